@@ -44,6 +44,14 @@ def setup_android_env():
         except:
             pass
 
+    # Datos locales (cola de escritura, caches) en el directorio files de la app
+    try:
+        from com.chaquo.python import Python
+        context = Python.getInstance().platform.getApplication()
+        ANDROID_CONFIG['DATA_DIR'] = os.path.join(str(context.getFilesDir()), 'podrida_data')
+    except Exception:
+        pass
+
     for key, value in ANDROID_CONFIG.items():
         if key not in os.environ or not os.environ[key]:
             os.environ[key] = value
@@ -5,7 +5,6 @@ This module initializes the Flask application using the application factory patt
 """
 
 from flask import Flask
-from dotenv import load_dotenv
 import os
 
 # Configurar entorno Android si está disponible
@@ -18,11 +17,14 @@ except ImportError:
     # No estamos en Android, usar configuración normal
     pass
 
-# Load environment variables (solo si no es Android)
+# Load environment variables (solo si no es Android: allí python-dotenv ni se importa)
 try:
-    if not is_android():
-        load_dotenv()
-except:
+    _load_dotenv = not is_android()
+except NameError:
+    _load_dotenv = True
+
+if _load_dotenv:
+    from dotenv import load_dotenv
     load_dotenv()
 
 
@@ -42,10 +44,11 @@ def create_app():
     app.config['SESSION_COOKIE_SECURE'] = os.getenv('SESSION_COOKIE_SECURE', 'False') == 'True'
     
     # Register blueprints (routes)
-    from app.routes import auth, admin, tournament, game
+    from app.routes import auth, admin, tournament, game, metrics
     app.register_blueprint(auth.bp)
     app.register_blueprint(admin.bp)
     app.register_blueprint(tournament.bp)
     app.register_blueprint(game.bp)
+    app.register_blueprint(metrics.bp)
     
     return app
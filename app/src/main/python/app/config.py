@@ -5,10 +5,8 @@ This module manages application configuration from environment variables.
 """
 
 import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Environment variables (.env) are loaded by the app package before this module is imported
 
 
 class Config:
@@ -28,6 +26,34 @@ class Config:
     # Google Sheets API
     GOOGLE_SERVICE_ACCOUNT_FILE = os.getenv('GOOGLE_SERVICE_ACCOUNT_FILE', 'credentials.json')
     USERS_SHEET_ID = os.getenv('USERS_SHEET_ID', '')
+    USERS_CACHE_TTL = float(os.getenv('USERS_CACHE_TTL', '300'))
+    TOURNAMENTS_CACHE_TTL = float(os.getenv('TOURNAMENTS_CACHE_TTL', '60'))
+    ROSTER_CACHE_TTL = float(os.getenv('ROSTER_CACHE_TTL', '120'))
+    SHEETS_POOL_SIZE = int(os.getenv('SHEETS_POOL_SIZE', '10'))
+    
+    # Google API quota scheduling (token bucket + retry)
+    SHEETS_RATE_PER_MINUTE = float(os.getenv('SHEETS_RATE_PER_MINUTE', '60'))
+    SHEETS_BURST = int(os.getenv('SHEETS_BURST', '10'))
+    SHEETS_MAX_RETRIES = int(os.getenv('SHEETS_MAX_RETRIES', '5'))
+    
+    # Sheets backend: 'google' (live API) or 'fake' (in-memory, for benchmarks and load tests)
+    SHEETS_BACKEND = os.getenv('SHEETS_BACKEND', 'google').lower()
+    SHEETS_FAKE_LATENCY = float(os.getenv('SHEETS_FAKE_LATENCY', '0'))
+    SHEETS_FAKE_ERROR_RATE = float(os.getenv('SHEETS_FAKE_ERROR_RATE', '0'))
+    SHEETS_FAKE_QUOTA_PER_MINUTE = int(os.getenv('SHEETS_FAKE_QUOTA_PER_MINUTE', '0'))
+    
+    # Local storage (write queue, journal, caches)
+    DATA_DIR = os.getenv('DATA_DIR', os.path.join(os.path.expanduser('~'), '.podrida_scoring'))
+    
+    # Write-behind sync: failed attempts before a batch is set aside (retried on next start)
+    SHEETS_SYNC_MAX_ATTEMPTS = int(os.getenv('SHEETS_SYNC_MAX_ATTEMPTS', '12'))
+    
+    # Live scoreboard for spectators: port served on the device's LAN address (0 disables it)
+    LIVE_SHARE_PORT = int(os.getenv('LIVE_SHARE_PORT', '5001'))
+    
+    # Active games kept hydrated in memory (LRU bounded by count and approximate size)
+    GAME_CACHE_SIZE = int(os.getenv('GAME_CACHE_SIZE', '8'))
+    GAME_CACHE_MAX_BYTES = int(os.getenv('GAME_CACHE_MAX_BYTES', '1048576'))
     
     @staticmethod
     def is_development():
@@ -43,7 +69,7 @@ class Config:
             ValueError: If required configuration is missing
         """
         if not Config.is_development():
-            if not os.path.exists(Config.GOOGLE_SERVICE_ACCOUNT_FILE):
+            if Config.SHEETS_BACKEND != 'fake' and not os.path.exists(Config.GOOGLE_SERVICE_ACCOUNT_FILE):
                 raise ValueError(f"Google service account file not found: {Config.GOOGLE_SERVICE_ACCOUNT_FILE}")
             
             if not Config.USERS_SHEET_ID:
@@ -20,8 +20,16 @@ class Game:
         current_hand_index (int): Index of current hand being played
         dealer_index (int): Index of current dealer
         sheet_name (str): Name of game sheet in Google Sheets
+        next_row (int): Game sheet row where the next hand result is written
     """
     
+    # First data row in the game sheet (rows 1-8 hold the header)
+    FIRST_HAND_ROW = 9
+    
+    __slots__ = ('tournament_name', 'tournament_id', 'players', 'game_mode', 'hands',
+                 'current_hand_index', 'dealer_index', 'sheet_name', 'next_row',
+                 'current_bids', 'current_tricks')
+    
     def __init__(self, tournament_name, tournament_id, players, game_mode, hands):
         """
         Initialize a game.
@@ -44,6 +52,7 @@ class Game:
         # Generate sheet name with timestamp
         now = datetime.now()
         self.sheet_name = now.strftime('%y-%m-%d#%H-%M-%S')
+        self.next_row = Game.FIRST_HAND_ROW
         
         # Current hand state
         self.current_bids = {}  # {player_name: bid}
@@ -72,6 +81,7 @@ class Game:
     def advance_to_next_hand(self):
         """Advance to the next hand and update dealer."""
         self.current_hand_index += 1
+        self.next_row += 1
         self.current_bids = {}
         self.current_tricks = {}
         
@@ -104,6 +114,7 @@ class Game:
             'current_hand_index': self.current_hand_index,
             'dealer_index': self.dealer_index,
             'sheet_name': self.sheet_name,
+            'next_row': self.next_row,
             'current_bids': self.current_bids,
             'current_tricks': self.current_tricks
         }
@@ -132,6 +143,7 @@ class Game:
         game.current_hand_index = data.get('current_hand_index', 0)
         game.dealer_index = data.get('dealer_index', 0)
         game.sheet_name = data.get('sheet_name', game.sheet_name)
+        game.next_row = data.get('next_row', Game.FIRST_HAND_ROW + game.current_hand_index)
         game.current_bids = data.get('current_bids', {})
         game.current_tricks = data.get('current_tricks', {})
         
@@ -4,6 +4,93 @@ Player Model
 Represents a player in the Oh Hell! card game.
 """
 
+from array import array
+
+
+class HandHistory:
+    """
+    Compact per-hand results of a player.
+    
+    Bids, tricks won and scores are stored in three typed arrays (signed
+    16-bit) instead of one dict per hand. Indexing and iteration still yield
+    {bid, won, score} dicts, so templates and callers can use it like a list.
+    """
+    
+    __slots__ = ('bids', 'won', 'scores')
+    
+    def __init__(self, bids=(), won=(), scores=()):
+        """
+        Initialize the history.
+        
+        Args:
+            bids (iterable): Tricks bid per hand
+            won (iterable): Tricks won per hand
+            scores (iterable): Score per hand
+        """
+        self.bids = array('h', bids)
+        self.won = array('h', won)
+        self.scores = array('h', scores)
+    
+    def append(self, bid, won, score):
+        """
+        Add the result of a hand.
+        
+        Args:
+            bid (int): Number of tricks bid
+            won (int): Number of tricks won
+            score (int): Score for this hand
+        """
+        self.bids.append(bid)
+        self.won.append(won)
+        self.scores.append(score)
+    
+    def __len__(self):
+        return len(self.bids)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return {'bid': self.bids[index], 'won': self.won[index], 'score': self.scores[index]}
+    
+    def __iter__(self):
+        for bid, won, score in zip(self.bids, self.won, self.scores):
+            yield {'bid': bid, 'won': won, 'score': score}
+    
+    def to_dict(self):
+        """
+        Convert the history to its compact dictionary representation.
+        
+        Returns:
+            dict: {bids, won, scores} lists
+        """
+        return {
+            'bids': self.bids.tolist(),
+            'won': self.won.tolist(),
+            'scores': self.scores.tolist()
+        }
+    
+    @staticmethod
+    def from_dict(data):
+        """
+        Create a HandHistory from Player.to_dict() data.
+        
+        Accepts both the compact {bids, won, scores} form and the older
+        'hands' list of {bid, won, score} dicts.
+        
+        Args:
+            data (dict): Player data
+        
+        Returns:
+            HandHistory: New history
+        """
+        if 'bids' in data:
+            return HandHistory(data['bids'], data['won'], data['scores'])
+        
+        hands = data.get('hands', [])
+        return HandHistory([hand['bid'] for hand in hands],
+                           [hand['won'] for hand in hands],
+                           [hand['score'] for hand in hands])
+
 
 class Player:
     """
@@ -12,10 +99,12 @@ class Player:
     Attributes:
         name (str): Player's name
         total_score (int): Cumulative game score
-        hands (list): List of hand results {bid, won, score}
+        hands (HandHistory): Hand results, yielded as {bid, won, score} dicts
         is_invicto (bool): True if player has exact bid in all hands
     """
     
+    __slots__ = ('name', 'total_score', 'hands', 'is_invicto')
+    
     def __init__(self, name):
         """
         Initialize a player.
@@ -25,7 +114,7 @@ class Player:
         """
         self.name = name
         self.total_score = 0
-        self.hands = []
+        self.hands = HandHistory()
         self.is_invicto = True
     
     def add_hand_result(self, bid, won, score):
@@ -37,11 +126,7 @@ class Player:
             won (int): Number of tricks won
             score (int): Score for this hand
         """
-        self.hands.append({
-            'bid': bid,
-            'won': won,
-            'score': score
-        })
+        self.hands.append(bid, won, score)
         self.total_score += score
         
         # Update invicto status (exact bid = bid == won)
@@ -53,14 +138,15 @@ class Player:
         Convert player to dictionary representation.
         
         Returns:
-            dict: Player data
+            dict: Player data (hand results as compact bids/won/scores lists)
         """
-        return {
+        data = {
             'name': self.name,
             'total_score': self.total_score,
-            'hands': self.hands,
             'is_invicto': self.is_invicto
         }
+        data.update(self.hands.to_dict())
+        return data
     
     @staticmethod
     def from_dict(data):
@@ -75,6 +161,6 @@ class Player:
         """
         player = Player(data['name'])
         player.total_score = data.get('total_score', 0)
-        player.hands = data.get('hands', [])
+        player.hands = HandHistory.from_dict(data)
         player.is_invicto = data.get('is_invicto', True)
         return player
@@ -4,8 +4,6 @@ User Model
 Represents a user in the system with authentication capabilities.
 """
 
-import bcrypt
-
 
 class User:
     """
@@ -35,6 +33,8 @@ class User:
         Args:
             plain_password (str): Plain text password to hash
         """
+        import bcrypt
+        
         salt = bcrypt.gensalt()
         self.password_hash = bcrypt.hashpw(plain_password.encode('utf-8'), salt).decode('utf-8')
     
@@ -50,6 +50,8 @@ class User:
         """
         if not self.password_hash:
             return False
+        
+        import bcrypt
         return bcrypt.checkpw(
             plain_password.encode('utf-8'),
             self.password_hash.encode('utf-8')
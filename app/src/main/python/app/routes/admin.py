@@ -6,8 +6,6 @@ Handles user management for admin users.
 
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from app.routes.auth import admin_required
-from app.services.user_service import UserService
-from app.models.user import User
 
 bp = Blueprint('admin', __name__, url_prefix='/admin')
 
@@ -16,6 +14,8 @@ bp = Blueprint('admin', __name__, url_prefix='/admin')
 @admin_required
 def manage_users():
     """Admin page for managing users."""
+    from app.services.user_service import UserService
+    
     user_service = UserService()
     users = user_service.get_all_users()
     return render_template('admin.html', users=users)
@@ -25,6 +25,9 @@ def manage_users():
 @admin_required
 def add_user():
     """Add a new user."""
+    from app.services.user_service import UserService
+    from app.models.user import User
+    
     username = request.form.get('username', '').strip()
     password = request.form.get('password', '')
     
@@ -56,6 +59,8 @@ def add_user():
 @admin_required
 def edit_user():
     """Edit an existing user."""
+    from app.services.user_service import UserService
+    
     old_username = request.form.get('old_username', '').strip()
     new_username = request.form.get('new_username', '').strip()
     new_password = request.form.get('new_password', '')
@@ -88,6 +93,8 @@ def edit_user():
 @admin_required
 def delete_user():
     """Delete a user."""
+    from app.services.user_service import UserService
+    
     username = request.form.get('username', '').strip()
     
     if not username:
@@ -108,6 +115,8 @@ def delete_user():
 @admin_required
 def reset_password():
     """Reset (blank) a user's password."""
+    from app.services.user_service import UserService
+    
     username = request.form.get('username', '').strip()
     
     if not username:
@@ -5,7 +5,6 @@ Handles login, logout, and authentication flow.
 """
 
 from flask import Blueprint, render_template, request, redirect, url_for, session, flash
-from app.services.auth_service import AuthService
 from app.config import Config
 
 bp = Blueprint('auth', __name__)
@@ -23,7 +22,8 @@ def login():
         username = request.form.get('username', '').strip()
         password = request.form.get('password', '')
         
-        # Attempt authentication
+        # Attempt authentication (the Google client stack loads on first use, not for the login page)
+        from app.services.auth_service import AuthService
         user = AuthService.authenticate_user(username, password)
         
         if user:
@@ -63,6 +63,8 @@ def debug_config():
 @bp.route('/dev-bypass')
 def dev_bypass():
     """Development mode bypass (only works in dev mode)."""
+    from app.services.auth_service import AuthService
+    
     if not AuthService.can_bypass_auth():
         flash('Development bypass is not enabled', 'error')
         return redirect(url_for('auth.login'))
@@ -4,19 +4,32 @@ Game Routes
 Handles game configuration, bidding, tricks, and scoring.
 """
 
-from flask import Blueprint, render_template, request, redirect, url_for, session, flash, jsonify
+from flask import Blueprint, render_template, request, redirect, url_for, session, flash, jsonify, Response, abort
 import json
+import queue
 from app.routes.auth import login_required
 from app.services.game_service import GameService
-from app.services.game_sheet_service import GameSheetService
+from app.services.sheet_write_queue import get_write_queue
+from app.services.game_store import get_game_store
+from app.services.live_broker import get_live_broker
+from app.services.live_share import get_live_share
 from app.models.game import Game
 from app.models.player import Player
-from app.utils.decorators import require_players, require_game_config, require_dealer_config, require_active_game
-from app.utils.session_helpers import clear_game_session
+from app.utils.decorators import require_players, require_game_config, require_dealer_config, require_active_game, lock_active_game
+from app.utils.session_helpers import (clear_game_session, get_active_game, start_active_game,
+                                       save_active_game)
 
 bp = Blueprint('game', __name__, url_prefix='/game')
 
 
+@bp.app_context_processor
+def inject_active_game():
+    """Expose the active game to every template."""
+    if not session.get('game_id'):
+        return {'active_game': None}
+    return {'active_game': get_active_game()}
+
+
 @bp.route('/mode')
 @login_required
 @require_players
@@ -245,22 +258,46 @@ def start_game():
     # Create Game object
     game = Game(tournament_name, tournament_id, players, game_mode, hands)
     
-    # Create game sheet in Google Sheets
-    game_sheet_service = GameSheetService()
-    if game_sheet_service.create_game_sheet(
-        tournament_id,
-        game.sheet_name,
-        tournament_name,
-        players,
-        game
-    ):
-        # Store game in session
-        session['game'] = game.to_dict()
-        flash('Game started!', 'success')
-        return redirect(url_for('game.play_hand'))
-    else:
+    # Journal the game and queue the game sheet creation (applied in the background)
+    # before activating it, so a game without a sheet never becomes active
+    try:
+        get_write_queue().enqueue(tournament_id, 'create_game_sheet', {
+            'sheet_name': game.sheet_name,
+            'game': game.to_dict()
+        })
+    except Exception as e:
+        print(f"Error queueing game sheet creation: {e}")
         flash('Error creating game sheet', 'error')
         return redirect(url_for('game.summary'))
+    
+    # Store game server-side; the session only keeps its ID
+    start_active_game(game)
+    
+    flash('Game started!', 'success')
+    return redirect(url_for('game.play_hand'))
+
+
+def _next_bid_options(game):
+    """
+    Get the next bidder of the current hand and their legal bids.
+    
+    Args:
+        game (Game): Active game
+        
+    Returns:
+        dict: {next_bidder, allowed_bids} (None and [] once everyone has bid)
+    """
+    current_hand = game.get_current_hand()
+    player_names = [player.name for player in game.players]
+    next_bidder = GameService.get_next_bidder(player_names, game.dealer_index, game.current_bids)
+    
+    allowed_bids = []
+    if next_bidder is not None:
+        allowed_bids = GameService.get_allowed_bids(current_hand['cards'],
+                                                    next_bidder == game.get_current_dealer().name,
+                                                    sum(game.current_bids.values()))
+    
+    return {'next_bidder': next_bidder, 'allowed_bids': allowed_bids}
 
 
 @bp.route('/hand')
@@ -268,9 +305,7 @@ def start_game():
 @require_active_game
 def play_hand():
     """Current hand bidding/playing page."""
-    game_data = session.get('game')
-    
-    game = Game.from_dict(game_data)
+    game = get_active_game()
     current_hand = game.get_current_hand()
     
     if not current_hand:
@@ -285,129 +320,124 @@ def play_hand():
     # Get bidding order
     bidding_order = GameService.get_bidding_order(current_hand['dealer_index'], num_players)
     
+    # Legal bids, so the client can disable illegal options (Hook On) locally
+    bid_options = _next_bid_options(game)
+    
     return render_template('bidding.html',
                          game=game,
                          current_hand=current_hand,
                          bids_complete=bids_complete,
                          tricks_complete=tricks_complete,
-                         bidding_order=bidding_order)
+                         bidding_order=bidding_order,
+                         next_bidder=bid_options['next_bidder'],
+                         allowed_bids=bid_options['allowed_bids'],
+                         dealer_allowed_bids=GameService.get_dealer_allowed_bids(current_hand['cards']))
 
 
-# Additional game routes will be created in next batch
-# (bid recording, tricks recording, scoring, etc.)
-
-
-@bp.route('/hand/bid', methods=['POST'])
-@login_required
-@require_active_game
-def record_bid():
-    """Record a bid for a player."""
-    game_data = session.get('game')
-    
-    game = Game.from_dict(game_data)
-    current_hand = game.get_current_hand()
+def _commit_hand(game):
+    """
+    Score the current hand, queue its Google Sheets write and advance the game.
     
-    player_name = request.form.get('player_name')
-    bid = int(request.form.get('bid', 0))
+    The hand's bids and tricks must already be recorded in the game.
     
-    # Validate bid
-    if bid < 0 or bid > current_hand['cards']:
-        return jsonify({'success': False, 'error': 'Invalid bid'})
-    
-    # Check Hook On rule for dealer
-    dealer = game.get_current_dealer()
-    if player_name == dealer.name:
-        total_other_bids = sum(game.current_bids.values())
-        if not GameService.validate_dealer_bid(total_other_bids, bid, current_hand['cards']):
-            return jsonify({'success': False, 'error': 'Hook On rule violation'})
+    Args:
+        game (Game): Active game
+        
+    Returns:
+        dict: Configuration of the hand that was committed
+    """
+    current_hand = game.get_current_hand()
     
-    # Record bid
-    game.current_bids[player_name] = bid
+    # Calculate the hand's scores for all players at once
+    bids = [game.current_bids.get(player.name, 0) for player in game.players]
+    tricks = [game.current_tricks.get(player.name, 0) for player in game.players]
+    scores = GameService.calculate_hand_scores(bids, tricks)
+    players_data = []
     
-    # Update session
-    session['game'] = game.to_dict()
+    for player, bid, won, score in zip(game.players, bids, tricks, scores):
+        # Update player
+        player.add_hand_result(bid, won, score)
+        
+        players_data.append({
+            'bid': bid,
+            'won': won,
+            'score': score,
+            'total': player.total_score
+        })
     
-    return jsonify({
-        'success': True,
-        'total_bids': sum(game.current_bids.values()),
-        'bids_count': len(game.current_bids)
+    # Journal the hand and queue the Google Sheets write (applied in the background)
+    get_write_queue().enqueue(game.tournament_id, 'add_hand_result', {
+        'tournament_id': game.tournament_id,
+        'sheet_name': game.sheet_name,
+        'row': game.next_row,
+        'hand_number': current_hand['cards'],
+        'players_data': players_data
     })
-
-
-@bp.route('/hand/tricks', methods=['POST'])
-@login_required
-@require_active_game
-def record_tricks():
-    """Record tricks won for a player."""
-    game_data = session.get('game')
-    
-    game = Game.from_dict(game_data)
-    current_hand = game.get_current_hand()
     
-    player_name = request.form.get('player_name')
-    tricks = int(request.form.get('tricks', 0))
-    
-    # Validate tricks
-    if tricks < 0 or tricks > current_hand['cards']:
-        return jsonify({'success': False, 'error': 'Invalid tricks count'})
+    # Advance to next hand
+    game.advance_to_next_hand()
     
-    # Record tricks
-    game.current_tricks[player_name] = tricks
+    # Update game store
+    save_active_game(game)
     
-    # Update session
-    session['game'] = game.to_dict()
+    # Push the hand to live scoreboards
+    get_live_broker().publish(session['game_id'], 'hand', {
+        'hand': GameService.get_hand_results(game, game.current_hand_index - 1),
+        'scoreboard': GameService.get_scoreboard(game)
+    })
     
-    return jsonify({'success': True})
+    return current_hand
 
 
-@bp.route('/hand/calculate', methods=['POST'])
+@bp.route('/hand/commit', methods=['POST'])
 @login_required
 @require_active_game
-def calculate_scores():
-    """Calculate scores for the current hand."""
-    game_data = session.get('game')
+@lock_active_game
+def commit_hand():
+    """
+    Commit a whole hand in one request and return the updated scoreboard.
+    
+    JSON body: {hand_index, bids: [{player_name, bid}] in bidding order, tricks: {player_name: tricks}}.
+    A hand_index other than the current hand (a replayed or double-tapped submit) is rejected
+    with 409 Conflict.
+    """
+    game = get_active_game()
+    data = request.get_json(silent=True) or {}
+    
+    try:
+        hand_index = int(data['hand_index'])
+    except (KeyError, TypeError, ValueError):
+        return jsonify({'success': False, 'error': 'Invalid hand'})
+    if hand_index != game.current_hand_index:
+        return jsonify({'success': False, 'error': 'Hand already committed',
+                        'current_hand_index': game.current_hand_index}), 409
     
-    game = Game.from_dict(game_data)
     current_hand = game.get_current_hand()
+    if not current_hand:
+        return jsonify({'success': False, 'error': 'Game is complete'})
     
-    # Validate all tricks recorded
-    if len(game.current_tricks) != len(game.players):
-        flash('All tricks must be recorded', 'error')
-        return redirect(url_for('game.play_hand'))
-    
-    # Calculate scores for each player
-    players_data = []
-    
-    for player in game.players:
-        bid = game.current_bids.get(player.name, 0)
-        won = game.current_tricks.get(player.name, 0)
-        score = GameService.calculate_hand_score(bid, won)
-        
-        # Update player
-        player.add_hand_result(bid, won, score)
-        
-        players_data.append({
-            'bid': bid,
-            'won': won,
-            'score': score
-        })
-    
-    # Record in Google Sheets
-    game_sheet_service = GameSheetService()
-    game_sheet_service.add_hand_result(
-        game.tournament_id,
-        game.sheet_name,
-        current_hand['cards'],
-        players_data
-    )
+    player_names = [player.name for player in game.players]
+    try:
+        bids = [(entry['player_name'], int(entry['bid'])) for entry in data['bids']]
+        tricks = {name: int(won) for name, won in (data.get('tricks') or {}).items()}
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return jsonify({'success': False, 'error': 'Invalid hand'})
     
-    # Advance to next hand
-    game.advance_to_next_hand()
+    # Validate the whole hand before changing anything
+    error = (GameService.get_bids_error(bids, player_names, game.dealer_index, current_hand['cards'])
+             or GameService.get_tricks_error(tricks, player_names, current_hand['cards']))
+    if error:
+        return jsonify({'success': False, 'error': error})
     
-    # Update session
-    session['game'] = game.to_dict()
+    game.current_bids = dict(bids)
+    game.current_tricks = tricks
+    _commit_hand(game)
     
-    return redirect(url_for('game.show_scores', hand_cards=current_hand['cards']))
+    return jsonify({
+        'success': True,
+        'scores_url': url_for('game.show_scores', hand_cards=current_hand['cards']),
+        'scoreboard': GameService.get_scoreboard(game)
+    })
 
 
 @bp.route('/scores/<int:hand_cards>')
@@ -415,12 +445,11 @@ def calculate_scores():
 @require_active_game
 def show_scores(hand_cards):
     """Show scores after a hand."""
-    game_data = session.get('game')
+    game = get_active_game()
     
-    game = Game.from_dict(game_data)
-    
-    # Sort players by score
-    sorted_players = GameService.get_sorted_players_by_score(game.players)
+    # Score the whole game in one pass and sort players by ranking
+    standings = GameService.score_game(game.players)
+    sorted_players = [game.players[i] for i in standings.ranking]
     
     # Check if game is complete
     is_complete = game.is_complete()
@@ -430,13 +459,103 @@ def show_scores(hand_cards):
     next_dealer = game.get_current_dealer() if not is_complete else None
     
     return render_template('scoring.html',
+                         live_url=get_live_share().url(url_for('game.live_scoreboard', game_id=session['game_id'])),
                          players=sorted_players,
                          hand_cards=hand_cards,
                          is_complete=is_complete,
                          next_hand=next_hand,
                          next_dealer=next_dealer,
                          game_mode=game.game_mode,
-                         game=game)
+                         game=game,
+                         sync_status=get_write_queue().status(game.tournament_id))
+
+
+@bp.route('/sync-status')
+@login_required
+@require_active_game
+def sync_status():
+    """Google Sheets sync status for the active game's tournament."""
+    game = get_active_game()
+    
+    return jsonify(get_write_queue().status(game.tournament_id))
+
+
+def _sse(event, data):
+    """Format a Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@bp.route('/live/<game_id>')
+def live_scoreboard(game_id):
+    """Read-only live scoreboard page (no login; served to the LAN by the live share server)."""
+    game = get_game_store().get(game_id)
+    if game is None:
+        abort(404)
+    
+    last_hand = None
+    if game.current_hand_index > 0:
+        last_hand = GameService.get_hand_results(game, game.current_hand_index - 1)
+    
+    return render_template('live.html',
+                         game_id=game_id,
+                         game=game,
+                         scoreboard=GameService.get_scoreboard(game),
+                         last_hand=last_hand)
+
+
+@bp.route('/live/<game_id>/scoreboard')
+def live_scoreboard_json(game_id):
+    """
+    Versioned read-only scoreboard JSON.
+    
+    The ETag is the game's hand counter: a matching If-None-Match gets
+    304 Not Modified. ?since=<version> limits the hands to those played after it.
+    """
+    game = get_game_store().get(game_id)
+    if game is None:
+        abort(404)
+    
+    etag = str(game.current_hand_index)
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        since = request.args.get('since', 0, type=int)
+        response = jsonify(GameService.get_scoreboard_delta(game, since))
+    
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+@bp.route('/live/<game_id>/stream')
+def live_stream(game_id):
+    """Server-Sent Events stream of a game: a scoreboard snapshot, then each committed hand."""
+    game = get_game_store().get(game_id)
+    if game is None:
+        abort(404)
+    
+    # Subscribe before taking the snapshot so no hand is missed in between
+    broker = get_live_broker()
+    subscriber = broker.subscribe(game_id)
+    snapshot = GameService.get_scoreboard(game)
+    
+    def stream():
+        try:
+            yield 'retry: 3000\n' + _sse('scoreboard', snapshot)
+            while True:
+                try:
+                    event, data = subscriber.get(timeout=15)
+                except queue.Empty:
+                    if not broker.is_subscribed(game_id, subscriber):
+                        return  # Dropped as too slow: the client reconnects
+                    yield ': keepalive\n\n'
+                    continue
+                yield _sse(event, data)
+        finally:
+            broker.unsubscribe(game_id, subscriber)
+    
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 
 @bp.route('/new-game', methods=['POST'])
@@ -466,9 +585,7 @@ def new_game_same_config():
 @require_active_game
 def final_scores():
     """Show final scores (redirect to last hand scores)."""
-    game_data = session.get('game')
-    
-    game = Game.from_dict(game_data)
+    game = get_active_game()
     
     # Get the last hand that was played
     if game.current_hand_index > 0:
@@ -0,0 +1,50 @@
+"""
+Metrics Routes
+
+Accounts every request and exposes the process metrics (Google API calls,
+bytes and latency per operation and route) at /metrics and the warm-up
+readiness at /ready.
+"""
+
+import time
+from flask import Blueprint, Response, request, g, jsonify
+from app.services.metrics import get_metrics
+from app.services.warmup import get_warmup
+
+bp = Blueprint('metrics', __name__)
+
+
+@bp.before_app_request
+def begin_request_metrics():
+    """Start accounting the request's Google API calls."""
+    g.request_start = time.perf_counter()
+    get_metrics().begin_request(request.endpoint or 'unknown')
+
+
+@bp.after_app_request
+def end_request_metrics(response):
+    """Record the request and summarize its Google API calls in a Server-Timing header."""
+    start = g.pop('request_start', None)
+    if start is None:
+        return response
+    
+    elapsed = time.perf_counter() - start
+    summary = get_metrics().end_request(response.status_code, elapsed)
+    response.headers['Server-Timing'] = (
+        f'sheets;desc="{summary["calls"]} calls, {summary["bytes"]} B";dur={summary["seconds"] * 1000:.1f}, '
+        f'app;dur={elapsed * 1000:.1f}'
+    )
+    return response
+
+
+@bp.route('/metrics')
+def metrics():
+    """Process metrics in the Prometheus text format."""
+    return Response(get_metrics().render(), mimetype='text/plain; version=0.0.4')
+
+
+@bp.route('/ready')
+def ready():
+    """Warm-up state and steps: 200 once the Google client is warm, 503 before that or if it failed."""
+    status = get_warmup().status()
+    return jsonify(status), 200 if status['state'] == 'ready' else 503
@@ -6,7 +6,6 @@ Handles tournament selection and player management.
 
 from flask import Blueprint, render_template, request, redirect, url_for, session, flash
 from app.routes.auth import login_required
-from app.services.tournament_service import TournamentService
 from app.config import Config
 
 bp = Blueprint('tournament', __name__, url_prefix='/tournament')
@@ -16,6 +15,8 @@ bp = Blueprint('tournament', __name__, url_prefix='/tournament')
 @login_required
 def select_tournament():
     """Tournament selection page."""
+    from app.services.tournament_service import TournamentService
+    
     tournament_service = TournamentService()
     all_spreadsheets = tournament_service.list_spreadsheets()
     
@@ -51,6 +52,8 @@ def set_tournament():
 @login_required
 def select_players():
     """Player selection page."""
+    from app.services.tournament_service import TournamentService
+    
     tournament_id = session.get('tournament_id')
     
     if not tournament_id:
@@ -73,6 +76,8 @@ def select_players():
 @login_required
 def add_player():
     """Add a new player to the tournament."""
+    from app.services.tournament_service import TournamentService
+    
     tournament_id = session.get('tournament_id')
     
     if not tournament_id:
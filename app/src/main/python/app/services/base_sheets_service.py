@@ -1,48 +1,217 @@
+import json
+import threading
+import time
 import gspread
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
 from app.config import Config
+from app.services.metrics import get_metrics, operation_name
+from app.services.request_scheduler import get_scheduler
+
+# Define the required scopes
+SCOPES = (
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive'
+)
+
+# POST operations that are safe to repeat: they set values rather than add or remove anything
+IDEMPOTENT_POST_OPERATIONS = ('values.batchUpdate', 'values.batchGet', 'values.clear', 'values.batchClear')
+
+# spreadsheets.batchUpdate requests that are safe to repeat (formatting and properties)
+IDEMPOTENT_BATCH_REQUESTS = ('repeatCell', 'mergeCells', 'unmergeCells', 'updateCells',
+                             'updateDimensionProperties', 'updateSheetProperties')
+
+# Process-wide client registry: {(service_account_file, scopes): gspread.Client}
+_clients = {}
+_clients_lock = threading.Lock()
+
+# Opened spreadsheet handles: {sheet_id: Spreadsheet}
+_spreadsheets = {}
+_spreadsheets_lock = threading.Lock()
+
+
+class SharedAuthorizedSession(AuthorizedSession):
+    """
+    Authorized session shared by all request threads.
+    
+    Keeps a keep-alive connection pool to the Google endpoints and refreshes
+    the OAuth token under a lock, so concurrent requests reuse one token
+    instead of racing to fetch their own.
+    """
+    
+    def __init__(self, credentials, pool_size):
+        """
+        Initialize the shared session.
+        
+        Args:
+            credentials: google-auth credentials
+            pool_size (int): Maximum number of pooled connections per host
+        """
+        super().__init__(credentials)
+        self._refresh_lock = threading.Lock()
+        self.mount('https://', HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+    
+    def ensure_token(self):
+        """Refresh the access token if it is missing or expired."""
+        if not self.credentials.valid:
+            with self._refresh_lock:
+                if not self.credentials.valid:
+                    self.credentials.refresh(self._auth_request)
+    
+    def request(self, method, url, *args, **kwargs):
+        """Send a request, refreshing the shared token first if needed."""
+        self.ensure_token()
+        return super().request(method, url, *args, **kwargs)
+
+
+class SchedulingClient(gspread.Client):
+    """
+    gspread client that sends every API call through the request scheduler.
+    
+    Each call is accounted in the metrics registry: operation, attempts,
+    bytes sent and received, and latency (rate limiting and retries included).
+    """
+    
+    def request(self, method, endpoint, params=None, data=None, json=None, files=None, headers=None):
+        """Send an API request, rate limited and retried by the scheduler."""
+        attempts = 0
+        
+        def send():
+            nonlocal attempts
+            attempts += 1
+            return gspread.Client.request(self, method, endpoint, params=params, data=data,
+                                          json=json, files=files, headers=headers)
+        
+        operation = operation_name(method, endpoint)
+        response = None
+        start = time.perf_counter()
+        try:
+            response = get_scheduler().call(send, idempotent=_is_idempotent(method, operation, json))
+            return response
+        finally:
+            get_metrics().record_call(
+                operation,
+                time.perf_counter() - start,
+                attempts=attempts,
+                bytes_sent=_body_size(json, data),
+                bytes_received=len(response.content) if response is not None else 0,
+                error=response is None
+            )
+
+
+def _is_idempotent(method, operation, json_body):
+    """
+    Check if an API call can be repeated without changing its result.
+    
+    Appends, file creation and structural batchUpdate requests (addSheet,
+    deleteDimension, ...) are not: retrying one the server already applied
+    would add or delete a second row, sheet or file.
+    
+    Args:
+        method (str): HTTP method
+        operation (str): Operation name (see operation_name())
+        json_body (dict): Request body
+    
+    Returns:
+        bool: True if the call is safe to retry after an ambiguous failure
+    """
+    if method.lower() != 'post' or operation in IDEMPOTENT_POST_OPERATIONS:
+        return True
+    if operation == 'spreadsheets.batchUpdate' and json_body:
+        return all(set(request) <= set(IDEMPOTENT_BATCH_REQUESTS) for request in json_body.get('requests', []))
+    return False
+
+
+def _body_size(json_body, data):
+    """Size in bytes of a request body as sent by gspread."""
+    if json_body is not None:
+        return len(json.dumps(json_body))
+    if isinstance(data, (bytes, str)):
+        return len(data)
+    return 0
+
+
+def get_shared_client(service_account_file=None):
+    """
+    Get the process-wide gspread client, authorizing it on first use.
+    
+    Credentials are loaded and the client is created only once per service
+    account file; every later call returns the same client, its cached
+    token and its connection pool.
+    
+    Args:
+        service_account_file (str, optional): Path to the service account JSON.
+                                              Defaults to Config.GOOGLE_SERVICE_ACCOUNT_FILE.
+    
+    Returns:
+        Client: Shared gspread client
+    
+    Raises:
+        Exception: If the credentials cannot be loaded
+    """
+    key = (service_account_file or Config.GOOGLE_SERVICE_ACCOUNT_FILE, SCOPES)
+    
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None and Config.SHEETS_BACKEND == 'fake':
+            # In-memory Sheets/Drive API in place of the authorized HTTP session
+            from app.services.fake_sheets import get_fake_backend
+            client = SchedulingClient(auth=None, session=get_fake_backend())
+            _clients[key] = client
+        elif client is None:
+            # Load credentials from service account file
+            creds = Credentials.from_service_account_file(key[0], scopes=list(SCOPES))
+            session = SharedAuthorizedSession(creds, Config.SHEETS_POOL_SIZE)
+            client = SchedulingClient(auth=creds, session=session)
+            _clients[key] = client
+        return client
+
 
 class BaseSheetsService:
     """Base service for Google Sheets operations."""
     
     def __init__(self):
-        """Initialize Google Sheets service with service account credentials."""
-        # Define the required scopes
-        scopes = [
-            'https://www.googleapis.com/auth/spreadsheets',
-            'https://www.googleapis.com/auth/drive'
-        ]
-        
+        """Initialize Google Sheets service with the shared client."""
         try:
-            # Load credentials from service account file
-            creds = Credentials.from_service_account_file(
-                Config.GOOGLE_SERVICE_ACCOUNT_FILE,
-                scopes=scopes
-            )
-            self.client = gspread.authorize(creds)
+            self.client = get_shared_client()
         except Exception as e:
             print(f"Warning: Could not initialize Google Sheets: {e}")
             self.client = None
-
+    
     def get_spreadsheet(self, sheet_id):
         """
         Get a spreadsheet by ID.
         
+        Spreadsheet handles are cached for the life of the process, so
+        only the first open of each spreadsheet fetches its metadata.
+        
         Args:
             sheet_id (str): Google Sheet ID
-            
+        
         Returns:
             Spreadsheet: Spreadsheet object or None
         """
         if not self.client:
             return None
         
+        spreadsheet = _spreadsheets.get(sheet_id)
+        if spreadsheet is not None:
+            return spreadsheet
+        
         try:
-            return self.client.open_by_key(sheet_id)
+            spreadsheet = self.client.open_by_key(sheet_id)
         except Exception as e:
             print(f"Error opening spreadsheet: {e}")
             return None
-
+        
+        with _spreadsheets_lock:
+            return _spreadsheets.setdefault(sheet_id, spreadsheet)
+    
     @staticmethod
     def _column_letter(col_num):
         """
@@ -50,7 +219,7 @@ class BaseSheetsService:
         
         Args:
             col_num (int): Column number (1-indexed)
-            
+        
         Returns:
             str: Column letter
         """
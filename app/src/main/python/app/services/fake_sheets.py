@@ -0,0 +1,630 @@
+"""
+Fake Sheets Backend
+
+In-process stand-in for the Google Sheets and Drive REST endpoints used by
+gspread. It plugs in as the HTTP session of the shared gspread client, so
+the real Client/Spreadsheet/Worksheet objects (and the request scheduler
+and metrics wrapped around them) run unchanged against in-memory
+spreadsheets. Latency and quota errors can be injected to benchmark and
+load-test full game flows without a Google account.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from urllib.parse import urlparse, unquote
+import requests
+from gspread.utils import a1_range_to_grid_range, rowcol_to_a1
+from app.config import Config
+
+SPREADSHEET_MIME_TYPE = 'application/vnd.google-apps.spreadsheet'
+
+# Spreadsheet batchUpdate requests that only change formatting (accepted, not rendered)
+FORMAT_REQUESTS = ('mergeCells', 'unmergeCells', 'repeatCell', 'updateDimensionProperties',
+                   'updateBorders', 'autoResizeDimensions', 'setBasicFilter')
+
+
+class FakeApiError(Exception):
+    """Error answered to the client as a Google API error response."""
+    
+    def __init__(self, code, status, message, reason=None):
+        super().__init__(message)
+        self.code = code
+        self.status = status
+        self.message = message
+        self.reason = reason
+    
+    def to_json(self):
+        """Google API error body."""
+        error = {'code': self.code, 'message': self.message, 'status': self.status}
+        if self.reason:
+            error['errors'] = [{'reason': self.reason, 'message': self.message}]
+        return {'error': error}
+
+
+class FakeWorksheet:
+    """
+    In-memory worksheet (grid of raw cell values).
+    
+    Attributes:
+        sheet_id (int): Grid ID
+        title (str): Worksheet title
+        row_count (int): Grid rows
+        col_count (int): Grid columns
+        rows (list): Cell values, grown on write
+    """
+    
+    def __init__(self, sheet_id, title, row_count=1000, col_count=26, rows=None):
+        self.sheet_id = sheet_id
+        self.title = title
+        self.row_count = row_count
+        self.col_count = col_count
+        self.rows = [list(row) for row in rows or []]
+    
+    def properties(self, index):
+        """Sheet properties as returned by spreadsheets.get."""
+        return {
+            'sheetId': self.sheet_id,
+            'title': self.title,
+            'index': index,
+            'sheetType': 'GRID',
+            'gridProperties': {'rowCount': self.row_count, 'columnCount': self.col_count}
+        }
+    
+    def read(self, start_row, start_col, end_row, end_col):
+        """
+        Read a block of rendered values (0-indexed, end exclusive).
+        
+        Trailing empty cells and rows are dropped, as the API does.
+        """
+        values = []
+        for r in range(start_row, min(end_row, len(self.rows))):
+            row = self.rows[r][start_col:end_col]
+            values.append([_render(value) for value in row])
+        
+        for row in values:
+            while row and row[-1] == '':
+                row.pop()
+        while values and not values[-1]:
+            values.pop()
+        return values
+    
+    def write(self, start_row, start_col, values):
+        """Write rows of values starting at a cell (None leaves a cell unchanged)."""
+        for i, row in enumerate(values):
+            r = start_row + i
+            while len(self.rows) <= r:
+                self.rows.append([])
+            cells = self.rows[r]
+            for j, value in enumerate(row):
+                if value is None:
+                    continue
+                c = start_col + j
+                if len(cells) <= c:
+                    cells.extend([''] * (c + 1 - len(cells)))
+                cells[c] = value
+    
+    def last_row(self, start_col, end_col):
+        """Index after the last row with a value in the given columns."""
+        for r in range(len(self.rows) - 1, -1, -1):
+            if any(value != '' for value in self.rows[r][start_col:end_col]):
+                return r + 1
+        return 0
+    
+    def delete(self, dimension, start, end):
+        """Delete rows or columns (0-indexed, end exclusive)."""
+        if dimension == 'ROWS':
+            del self.rows[start:end]
+            self.row_count -= end - start
+        else:
+            for row in self.rows:
+                del row[start:end]
+            self.col_count -= end - start
+
+
+class FakeSpreadsheet:
+    """
+    In-memory spreadsheet.
+    
+    Attributes:
+        id (str): Spreadsheet ID
+        title (str): Spreadsheet (Drive file) name
+        worksheets (list): FakeWorksheet objects in tab order
+        created (str): RFC 3339 creation time
+    """
+    
+    def __init__(self, spreadsheet_id, title):
+        self.id = spreadsheet_id
+        self.title = title
+        self.worksheets = []
+        self.created = time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
+        self.modified = self.created
+    
+    def metadata(self):
+        """Spreadsheet resource as returned by spreadsheets.get."""
+        return {
+            'spreadsheetId': self.id,
+            'properties': {'title': self.title, 'locale': 'en_US', 'timeZone': 'Etc/GMT'},
+            'sheets': [{'properties': ws.properties(i)} for i, ws in enumerate(self.worksheets)]
+        }
+    
+    def file(self):
+        """Drive file resource."""
+        return {
+            'kind': 'drive#file',
+            'id': self.id,
+            'name': self.title,
+            'mimeType': SPREADSHEET_MIME_TYPE,
+            'createdTime': self.created,
+            'modifiedTime': self.modified
+        }
+    
+    def by_title(self, title):
+        """Find a worksheet by title."""
+        for worksheet in self.worksheets:
+            if worksheet.title == title:
+                return worksheet
+        return None
+    
+    def by_id(self, sheet_id):
+        """Find a worksheet by grid ID or raise a 400 error."""
+        for worksheet in self.worksheets:
+            if worksheet.sheet_id == sheet_id:
+                return worksheet
+        raise FakeApiError(400, 'INVALID_ARGUMENT', f'No grid with id: {sheet_id}')
+
+
+class FakeSheetsBackend:
+    """
+    In-memory Sheets/Drive API answering gspread's HTTP requests.
+    
+    Used as the `session` of a gspread client: gspread calls
+    get/post/put/patch/delete with the REST endpoint URL and gets back a
+    requests.Response, exactly as with the real AuthorizedSession.
+    
+    Attributes:
+        latency (float): Mean injected latency per request in seconds
+        error_rate (float): Fraction of requests failing with HTTP 429
+        quota_per_minute (int): Requests allowed per rolling minute (0 = unlimited)
+    """
+    
+    def __init__(self, latency=0.0, error_rate=0.0, quota_per_minute=0, seed=None):
+        """
+        Initialize an empty backend.
+        
+        Args:
+            latency (float): Mean injected latency per request in seconds (+/- 50% jitter)
+            error_rate (float): Fraction of requests failing with HTTP 429
+            quota_per_minute (int): Requests allowed per rolling minute (0 = unlimited)
+            seed (int, optional): Random seed for reproducible latency and errors
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.quota_per_minute = quota_per_minute
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._spreadsheets = {}  # {id: FakeSpreadsheet}
+        self._recent = deque()  # Request times within the last minute (quota window)
+    
+    def add_spreadsheet(self, title, worksheets=None, spreadsheet_id=None):
+        """
+        Create a spreadsheet directly (e.g. to seed the users or a tournament sheet).
+        
+        Args:
+            title (str): Spreadsheet name
+            worksheets (dict, optional): {worksheet title: rows of values}.
+                                         Defaults to one empty 'Sheet1'.
+            spreadsheet_id (str, optional): Spreadsheet ID. Defaults to a random ID.
+        
+        Returns:
+            str: Spreadsheet ID
+        """
+        with self._lock:
+            spreadsheet = FakeSpreadsheet(spreadsheet_id or uuid.uuid4().hex, title)
+            for i, (name, rows) in enumerate((worksheets or {'Sheet1': []}).items()):
+                spreadsheet.worksheets.append(FakeWorksheet(i if i == 0 else self._new_sheet_id(), name, rows=rows))
+            self._spreadsheets[spreadsheet.id] = spreadsheet
+            return spreadsheet.id
+    
+    def get_values(self, spreadsheet_id, title):
+        """
+        Get every value of a worksheet (rendered as the API would).
+        
+        Args:
+            spreadsheet_id (str): Spreadsheet ID
+            title (str): Worksheet title
+        
+        Returns:
+            list: Rows of values or None if the worksheet does not exist
+        """
+        with self._lock:
+            spreadsheet = self._spreadsheets.get(spreadsheet_id)
+            worksheet = spreadsheet.by_title(title) if spreadsheet else None
+            if worksheet is None:
+                return None
+            return worksheet.read(0, 0, worksheet.row_count, worksheet.col_count)
+    
+    # requests.Session interface used by gspread.Client.request
+    
+    def get(self, url, **kwargs):
+        return self.request('get', url, **kwargs)
+    
+    def post(self, url, **kwargs):
+        return self.request('post', url, **kwargs)
+    
+    def put(self, url, **kwargs):
+        return self.request('put', url, **kwargs)
+    
+    def patch(self, url, **kwargs):
+        return self.request('patch', url, **kwargs)
+    
+    def delete(self, url, **kwargs):
+        return self.request('delete', url, **kwargs)
+    
+    def request(self, method, url, params=None, json=None, **kwargs):
+        """
+        Answer one API request.
+        
+        Args:
+            method (str): HTTP method
+            url (str): Endpoint URL
+            params (dict, optional): Query parameters
+            json (dict, optional): JSON body
+        
+        Returns:
+            requests.Response: API response (errors use the Google error format)
+        """
+        if self.latency:
+            time.sleep(self.latency * self._random.uniform(0.5, 1.5))
+        
+        try:
+            self._check_quota()
+            with self._lock:
+                body = self._dispatch(method.lower(), urlparse(url).path, params or {}, json or {})
+            return _response(200, body, url)
+        except FakeApiError as e:
+            return _response(e.code, e.to_json(), url)
+    
+    def _check_quota(self):
+        """Fail the request with HTTP 429 per the injected error rate and quota."""
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise FakeApiError(429, 'RESOURCE_EXHAUSTED', 'Quota exceeded (injected error)', 'rateLimitExceeded')
+        
+        if self.quota_per_minute:
+            now = time.monotonic()
+            with self._lock:
+                while self._recent and now - self._recent[0] >= 60:
+                    self._recent.popleft()
+                if len(self._recent) >= self.quota_per_minute:
+                    raise FakeApiError(429, 'RESOURCE_EXHAUSTED',
+                                       "Quota exceeded for quota metric 'Requests' per minute",
+                                       'rateLimitExceeded')
+                self._recent.append(now)
+    
+    def _dispatch(self, method, path, params, body):
+        """Route a request to its handler (caller holds the lock)."""
+        match = re.match(r'^/drive/v\d+/files(?:/([^/]+))?$', path)
+        if match:
+            return self._drive(method, match.group(1), params, body)
+        
+        match = re.match(r'^/v4/spreadsheets/([^/:]+)(.*)$', path)
+        if not match:
+            raise FakeApiError(404, 'NOT_FOUND', f'Unknown endpoint: {path}')
+        
+        spreadsheet = self._spreadsheets.get(match.group(1))
+        if spreadsheet is None:
+            raise FakeApiError(404, 'NOT_FOUND', 'Requested entity was not found.')
+        
+        rest = match.group(2)
+        if rest == '' and method == 'get':
+            return spreadsheet.metadata()
+        if rest == ':batchUpdate':
+            result = self._batch_update(spreadsheet, body)
+        elif rest == '/values:batchUpdate':
+            result = self._values_batch_update(spreadsheet, body)
+        elif rest == '/values:batchGet':
+            ranges = params.get('ranges', [])
+            ranges = [ranges] if isinstance(ranges, str) else ranges
+            return {'spreadsheetId': spreadsheet.id,
+                    'valueRanges': [self._values_get(spreadsheet, r, params) for r in ranges]}
+        elif rest.startswith('/values/'):
+            range_name, _, action = unquote(rest[len('/values/'):]).partition(':')
+            range_name, action = _split_action(range_name, action)
+            if method == 'get' and not action:
+                return self._values_get(spreadsheet, range_name, params)
+            if method == 'put' and not action:
+                result = self._values_update(spreadsheet, range_name, body)
+            elif action == 'append':
+                result = self._values_append(spreadsheet, range_name, body)
+            elif action == 'clear':
+                result = self._values_clear(spreadsheet, range_name)
+            else:
+                raise FakeApiError(400, 'INVALID_ARGUMENT', f'Unsupported values request: {rest}')
+        else:
+            raise FakeApiError(404, 'NOT_FOUND', f'Unknown endpoint: {path}')
+        
+        spreadsheet.modified = time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
+        return result
+    
+    def _drive(self, method, file_id, params, body):
+        """Drive files endpoints (list, create, get, delete)."""
+        if file_id is None:
+            if method == 'get':
+                title = None
+                match = re.search(r'name = "([^"]*)"', params.get('q', ''))
+                if match:
+                    title = match.group(1)
+                return {'kind': 'drive#fileList',
+                        'files': [s.file() for s in self._spreadsheets.values()
+                                  if title is None or s.title == title]}
+            if method == 'post':
+                spreadsheet_id = self.add_spreadsheet(body.get('name', 'Untitled spreadsheet'))
+                file = self._spreadsheets[spreadsheet_id].file()
+                return {key: file[key] for key in ('kind', 'id', 'name', 'mimeType')}
+        
+        spreadsheet = self._spreadsheets.get(file_id)
+        if spreadsheet is None:
+            raise FakeApiError(404, 'NOT_FOUND', f'File not found: {file_id}.', 'notFound')
+        if method == 'get':
+            return spreadsheet.file()
+        if method == 'delete':
+            del self._spreadsheets[file_id]
+            return {}
+        raise FakeApiError(400, 'INVALID_ARGUMENT', f'Unsupported Drive request: {method.upper()} {file_id}')
+    
+    def _batch_update(self, spreadsheet, body):
+        """spreadsheets.batchUpdate: sheet structure changes and formatting."""
+        replies = []
+        for i, request in enumerate(body.get('requests', [])):
+            kind, args = next(iter(request.items()))
+            if kind == 'addSheet':
+                properties = args.get('properties', {})
+                grid = properties.get('gridProperties', {})
+                worksheet = self._add_worksheet(spreadsheet, properties.get('title'), properties.get('index'),
+                                                grid.get('rowCount', 1000), grid.get('columnCount', 26))
+                replies.append({'addSheet': {'properties': worksheet.properties(spreadsheet.worksheets.index(worksheet))}})
+            elif kind == 'duplicateSheet':
+                source = spreadsheet.by_id(args['sourceSheetId'])
+                title = args.get('newSheetName') or f'Copy of {source.title}'
+                worksheet = self._add_worksheet(spreadsheet, title, args.get('insertSheetIndex'),
+                                                source.row_count, source.col_count, source.rows)
+                replies.append({'duplicateSheet': {'properties': worksheet.properties(spreadsheet.worksheets.index(worksheet))}})
+            elif kind == 'deleteSheet':
+                spreadsheet.worksheets.remove(spreadsheet.by_id(args['sheetId']))
+                replies.append({})
+            elif kind == 'updateSheetProperties':
+                properties = args['properties']
+                worksheet = spreadsheet.by_id(properties.get('sheetId', 0))
+                if 'title' in properties:
+                    if spreadsheet.by_title(properties['title']) not in (None, worksheet):
+                        raise _sheet_exists(properties['title'])
+                    worksheet.title = properties['title']
+                grid = properties.get('gridProperties', {})
+                worksheet.row_count = grid.get('rowCount', worksheet.row_count)
+                worksheet.col_count = grid.get('columnCount', worksheet.col_count)
+                replies.append({})
+            elif kind == 'deleteDimension':
+                grid_range = args['range']
+                spreadsheet.by_id(grid_range['sheetId']).delete(
+                    grid_range['dimension'], grid_range['startIndex'], grid_range['endIndex'])
+                replies.append({})
+            elif kind in FORMAT_REQUESTS:
+                grid_range = args.get('range') or args.get('dimensions') or {}
+                spreadsheet.by_id(grid_range.get('sheetId', 0))
+                replies.append({})
+            else:
+                raise FakeApiError(400, 'INVALID_ARGUMENT', f'Invalid requests[{i}]: unsupported request {kind}')
+        return {'spreadsheetId': spreadsheet.id, 'replies': replies}
+    
+    def _add_worksheet(self, spreadsheet, title, index, row_count, col_count, rows=None):
+        """Insert a new worksheet, rejecting duplicate titles."""
+        if spreadsheet.by_title(title) is not None:
+            raise _sheet_exists(title)
+        worksheet = FakeWorksheet(self._new_sheet_id(), title, row_count, col_count, rows)
+        spreadsheet.worksheets.insert(len(spreadsheet.worksheets) if index is None else index, worksheet)
+        return worksheet
+    
+    def _new_sheet_id(self):
+        """Random grid ID, as the API assigns."""
+        return self._random.randint(1, 2 ** 31 - 1)
+    
+    def _values_get(self, spreadsheet, range_name, params):
+        """values.get"""
+        worksheet, start_row, start_col, end_row, end_col = _resolve(spreadsheet, range_name)
+        values = worksheet.read(start_row, start_col, end_row, end_col)
+        major_dimension = params.get('majorDimension', 'ROWS')
+        if major_dimension == 'COLUMNS':
+            width = max((len(row) for row in values), default=0)
+            values = [[row[c] if c < len(row) else '' for row in values] for c in range(width)]
+            for column in values:
+                while column and column[-1] == '':
+                    column.pop()
+        
+        result = {'range': _a1(worksheet, start_row, start_col, end_row, end_col),
+                  'majorDimension': major_dimension}
+        if values:
+            result['values'] = values
+        return result
+    
+    def _values_update(self, spreadsheet, range_name, body):
+        """values.update"""
+        worksheet, start_row, start_col, _, _ = _resolve(spreadsheet, range_name)
+        return self._write(spreadsheet, worksheet, start_row, start_col, body)
+    
+    def _values_append(self, spreadsheet, range_name, body):
+        """values.append: write after the last row of the table, growing the grid."""
+        worksheet, _, start_col, _, end_col = _resolve(spreadsheet, range_name)
+        start_row = worksheet.last_row(start_col, end_col)
+        values = _rows(body.get('values', []))
+        worksheet.row_count = max(worksheet.row_count, start_row + len(values))
+        
+        updates = self._write(spreadsheet, worksheet, start_row, start_col, body)
+        result = {'spreadsheetId': spreadsheet.id, 'updates': updates}
+        if start_row:
+            result['tableRange'] = _a1(worksheet, 0, start_col, start_row, start_col + updates['updatedColumns'])
+        return result
+    
+    def _values_clear(self, spreadsheet, range_name):
+        """values.clear"""
+        worksheet, start_row, start_col, end_row, end_col = _resolve(spreadsheet, range_name)
+        for r in range(start_row, min(end_row, len(worksheet.rows))):
+            row = worksheet.rows[r]
+            for c in range(start_col, min(end_col, len(row))):
+                row[c] = ''
+        return {'spreadsheetId': spreadsheet.id,
+                'clearedRange': _a1(worksheet, start_row, start_col, end_row, end_col)}
+    
+    def _values_batch_update(self, spreadsheet, body):
+        """values.batchUpdate"""
+        responses = []
+        for value_range in body.get('data', []):
+            worksheet, start_row, start_col, _, _ = _resolve(spreadsheet, value_range['range'])
+            responses.append(self._write(spreadsheet, worksheet, start_row, start_col, value_range))
+        return {
+            'spreadsheetId': spreadsheet.id,
+            'totalUpdatedRows': sum(r['updatedRows'] for r in responses),
+            'totalUpdatedColumns': sum(r['updatedColumns'] for r in responses),
+            'totalUpdatedCells': sum(r['updatedCells'] for r in responses),
+            'totalUpdatedSheets': len({r['updatedRange'].rsplit('!', 1)[0] for r in responses}),
+            'responses': responses
+        }
+    
+    @staticmethod
+    def _write(spreadsheet, worksheet, start_row, start_col, value_range):
+        """Write a ValueRange body, enforcing the grid limits."""
+        values = _rows(value_range.get('values', []))
+        if value_range.get('majorDimension') == 'COLUMNS':
+            width = max((len(column) for column in values), default=0)
+            values = [[column[r] if r < len(column) else None for column in values] for r in range(width)]
+        
+        rows = len(values)
+        cols = max((len(row) for row in values), default=0)
+        if start_row + rows > worksheet.row_count or start_col + cols > worksheet.col_count:
+            raise FakeApiError(400, 'INVALID_ARGUMENT',
+                               f'Range ({worksheet.title}!{rowcol_to_a1(start_row + rows, start_col + cols)}) '
+                               f'exceeds grid limits. Max rows: {worksheet.row_count}, '
+                               f'max columns: {worksheet.col_count}')
+        
+        worksheet.write(start_row, start_col, values)
+        return {
+            'spreadsheetId': spreadsheet.id,
+            'updatedRange': _a1(worksheet, start_row, start_col, start_row + rows, start_col + cols),
+            'updatedRows': rows,
+            'updatedColumns': cols,
+            'updatedCells': sum(len(row) for row in values)
+        }
+
+
+def _response(status, body, url):
+    """Build a requests.Response carrying a JSON body."""
+    response = requests.Response()
+    response.status_code = status
+    response.reason = 'OK' if status == 200 else 'Error'
+    response.url = url
+    response.encoding = 'utf-8'
+    response.headers['Content-Type'] = 'application/json; charset=UTF-8'
+    response._content = json.dumps(body).encode('utf-8')
+    return response
+
+
+def _split_action(range_name, action):
+    """Split a ':append'/':clear' suffix from a range that may itself contain ':'."""
+    if action and not re.match(r'^[a-z]+$', action.rsplit(':', 1)[-1]):
+        return f'{range_name}:{action}', ''
+    if ':' in action:
+        rest, _, action = action.rpartition(':')
+        return f'{range_name}:{rest}', action
+    return range_name, action
+
+
+def _resolve(spreadsheet, range_name):
+    """
+    Resolve an A1 range to its worksheet and 0-indexed bounds (end exclusive).
+    
+    Accepts "'Sheet name'!A1:B2", "Sheet!A:A", a bare sheet name and, for
+    the first worksheet, a bare cell range.
+    """
+    match = re.match(r"^'((?:[^']|'')*)'(?:!(.*))?$", range_name)
+    if match:
+        title, cells = match.group(1).replace("''", "'"), match.group(2) or ''
+    elif '!' in range_name:
+        title, cells = range_name.rsplit('!', 1)
+    elif spreadsheet.by_title(range_name) is not None or not re.match(r'^[A-Za-z]*\d*(:[A-Za-z]*\d*)?$', range_name):
+        title, cells = range_name, ''
+    else:
+        title, cells = None, range_name
+    
+    worksheet = spreadsheet.worksheets[0] if title is None and spreadsheet.worksheets else spreadsheet.by_title(title)
+    if worksheet is None:
+        raise FakeApiError(400, 'INVALID_ARGUMENT', f'Unable to parse range: {range_name}')
+    
+    grid = a1_range_to_grid_range(cells.upper(), worksheet.sheet_id) if cells else {}
+    return (worksheet,
+            grid.get('startRowIndex', 0), grid.get('startColumnIndex', 0),
+            grid.get('endRowIndex', worksheet.row_count), grid.get('endColumnIndex', worksheet.col_count))
+
+
+def _a1(worksheet, start_row, start_col, end_row, end_col):
+    """Format 0-indexed bounds as the A1 range the API reports."""
+    title = worksheet.title if re.match(r'^\w+$', worksheet.title) else "'%s'" % worksheet.title.replace("'", "''")
+    start = rowcol_to_a1(start_row + 1, start_col + 1)
+    end = rowcol_to_a1(max(end_row, start_row + 1), max(end_col, start_col + 1))
+    return f'{title}!{start}' if start == end else f'{title}!{start}:{end}'
+
+
+def _rows(values):
+    """Normalize a values body to a list of rows."""
+    if not isinstance(values, list):
+        return [[values]]
+    return [row if isinstance(row, list) else [row] for row in values]
+
+
+def _render(value):
+    """Render a stored value as the API's FORMATTED_VALUE string."""
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _sheet_exists(title):
+    """Error answered when a worksheet title is already taken."""
+    return FakeApiError(400, 'INVALID_ARGUMENT',
+                        f'Invalid requests[0].addSheet: A sheet with the name "{title}" already exists. '
+                        f'Please enter another name.')
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_fake_backend():
+    """
+    Get the process-wide fake backend, configured from Config.
+    
+    The users spreadsheet (Config.USERS_SHEET_ID) is created empty so the
+    user service can set up its worksheet as it does on a new sheet.
+    
+    Returns:
+        FakeSheetsBackend: Shared backend
+    """
+    global _backend
+    
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                backend = FakeSheetsBackend(
+                    latency=Config.SHEETS_FAKE_LATENCY,
+                    error_rate=Config.SHEETS_FAKE_ERROR_RATE,
+                    quota_per_minute=Config.SHEETS_FAKE_QUOTA_PER_MINUTE
+                )
+                if Config.USERS_SHEET_ID:
+                    backend.add_spreadsheet('Users', spreadsheet_id=Config.USERS_SHEET_ID)
+                _backend = backend
+    
+    return _backend
@@ -0,0 +1,225 @@
+"""
+Game Journal
+
+Local append-only journal (SQLite in WAL mode) of the Google Sheets writes
+of each game: sheet creation and hand results. Entries stay pending until
+the sync engine marks them synced (or failed, once it gives up on them).
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+# sync_state values
+PENDING = 0
+SYNCED = 1
+FAILED = 2
+
+
+class GameJournal:
+    """
+    Append-only game journal backed by SQLite.
+    
+    Attributes:
+        path (str): SQLite database file
+    """
+    
+    def __init__(self, path):
+        """
+        Open (or create) the journal database.
+        
+        Args:
+            path (str): SQLite database file
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS journal ('
+            ' id INTEGER PRIMARY KEY AUTOINCREMENT,'
+            ' spreadsheet_id TEXT NOT NULL,'
+            ' sheet_name TEXT,'
+            ' kind TEXT NOT NULL,'
+            ' payload TEXT NOT NULL,'
+            ' created_at TEXT NOT NULL,'
+            ' sync_state INTEGER)'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS journal_pending'
+            ' ON journal (spreadsheet_id, id) WHERE sync_state = 0'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS journal_failed'
+            ' ON journal (spreadsheet_id, sheet_name) WHERE sync_state = 2'
+        )
+    
+    def append(self, spreadsheet_id, sheet_name, kind, payload):
+        """
+        Append a pending entry to the journal.
+        
+        If earlier entries of the same game sheet were set aside (failed),
+        the entry is set aside with them, so it is not replayed ahead of
+        them and the sheet's writes stay in order.
+        
+        Args:
+            spreadsheet_id (str): Tournament Google Sheet ID
+            sheet_name (str): Game sheet name
+            kind (str): Entry kind (e.g. 'add_hand_result')
+            payload (dict): JSON-serializable entry data
+        
+        Returns:
+            int: Entry ID
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                'INSERT INTO journal (spreadsheet_id, sheet_name, kind, payload, created_at, sync_state)'
+                ' SELECT ?, ?, ?, ?, ?, CASE WHEN EXISTS ('
+                '  SELECT 1 FROM journal WHERE sync_state = ? AND spreadsheet_id = ? AND sheet_name IS ?'
+                ' ) THEN ? ELSE ? END',
+                (spreadsheet_id, sheet_name, kind, json.dumps(payload),
+                 datetime.now().isoformat(timespec='seconds'),
+                 FAILED, spreadsheet_id, sheet_name, FAILED, PENDING)
+            )
+            return cursor.lastrowid
+    
+    def pending_spreadsheets(self):
+        """
+        Get spreadsheets with unsynced entries.
+        
+        Returns:
+            list: Spreadsheet IDs, oldest pending entry first
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT spreadsheet_id FROM journal WHERE sync_state = 0'
+                ' GROUP BY spreadsheet_id ORDER BY MIN(id)'
+            ).fetchall()
+        return [row[0] for row in rows]
+    
+    def pending(self, spreadsheet_id, limit=50):
+        """
+        Get unsynced entries for a spreadsheet in journal order.
+        
+        Args:
+            spreadsheet_id (str): Tournament Google Sheet ID
+            limit (int): Maximum number of entries
+        
+        Returns:
+            list: Entry dicts with {id, sheet_name, kind, payload}
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT id, sheet_name, kind, payload FROM journal'
+                ' WHERE sync_state = 0 AND spreadsheet_id = ? ORDER BY id LIMIT ?',
+                (spreadsheet_id, limit)
+            ).fetchall()
+        return [
+            {'id': row[0], 'sheet_name': row[1], 'kind': row[2], 'payload': json.loads(row[3])}
+            for row in rows
+        ]
+    
+    def pending_count(self, spreadsheet_id=None):
+        """
+        Count unsynced entries.
+        
+        Args:
+            spreadsheet_id (str, optional): Limit the count to one spreadsheet
+        
+        Returns:
+            int: Number of unsynced entries
+        """
+        return self._count(PENDING, spreadsheet_id)
+    
+    def failed_count(self, spreadsheet_id=None):
+        """
+        Count entries set aside until the next requeue_failed().
+        
+        Args:
+            spreadsheet_id (str, optional): Limit the count to one spreadsheet
+        
+        Returns:
+            int: Number of failed entries
+        """
+        return self._count(FAILED, spreadsheet_id)
+    
+    def _count(self, sync_state, spreadsheet_id=None):
+        """Count entries in a sync state, optionally for one spreadsheet."""
+        with self._lock:
+            if spreadsheet_id is None:
+                row = self._conn.execute(
+                    'SELECT COUNT(*) FROM journal WHERE sync_state = ?', (sync_state,)
+                ).fetchone()
+            else:
+                row = self._conn.execute(
+                    'SELECT COUNT(*) FROM journal WHERE sync_state = ? AND spreadsheet_id = ?',
+                    (sync_state, spreadsheet_id)
+                ).fetchone()
+        return row[0]
+    
+    def mark_synced(self, entry_ids):
+        """
+        Mark entries as synced to Google Sheets.
+        
+        Args:
+            entry_ids (list): Entry IDs
+        """
+        self._set_sync_state(entry_ids, SYNCED)
+    
+    def mark_sheet_failed(self, spreadsheet_id, sheet_name):
+        """
+        Set every pending entry of a game sheet aside after the sync engine
+        gave up on one of its batches.
+        
+        The whole sheet is set aside, not just the batch: a later batch would
+        otherwise sync first and the failed one, replayed after it, would
+        overwrite its totals. The entries stay in the journal, in order, and
+        no longer block the other sheets of the spreadsheet until
+        requeue_failed() makes them pending again.
+        
+        Args:
+            spreadsheet_id (str): Tournament Google Sheet ID
+            sheet_name (str): Game sheet name
+        
+        Returns:
+            int: Number of entries set aside
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                'UPDATE journal SET sync_state = ?'
+                ' WHERE sync_state = ? AND spreadsheet_id = ? AND sheet_name IS ?',
+                (FAILED, PENDING, spreadsheet_id, sheet_name)
+            )
+            return cursor.rowcount
+    
+    def requeue_failed(self):
+        """
+        Make every failed entry pending again.
+        
+        Returns:
+            int: Number of requeued entries
+        """
+        with self._lock:
+            cursor = self._conn.execute('UPDATE journal SET sync_state = ? WHERE sync_state = ?', (PENDING, FAILED))
+            return cursor.rowcount
+    
+    def _set_sync_state(self, entry_ids, sync_state):
+        """Set the sync state of entries in one transaction."""
+        if not entry_ids:
+            return
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.executemany(
+                    'UPDATE journal SET sync_state = ? WHERE id = ?',
+                    [(sync_state, entry_id) for entry_id in entry_ids]
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
@@ -4,6 +4,8 @@ Game Service
 Handles game logic including scoring, hand generation, and Hook On rule.
 """
 
+from app.services import scoring_engine
+
 
 class GameService:
     """Service for game logic operations."""
@@ -71,6 +73,112 @@ class GameService:
         # Hook On rule: dealer cannot make total bids equal cards dealt
         return (total_bids + dealer_bid) != cards_dealt
     
+    @staticmethod
+    def get_allowed_bids(cards_dealt, is_dealer=False, total_other_bids=0):
+        """
+        Get the legal bids for a player.
+        
+        Args:
+            cards_dealt (int): Number of cards dealt this hand
+            is_dealer (bool): True if the player is the dealer (Hook On rule applies)
+            total_other_bids (int): Sum of all other players' bids (dealer only)
+            
+        Returns:
+            list: Legal bids in ascending order
+        """
+        return [bid for bid in range(cards_dealt + 1)
+                if not is_dealer or GameService.validate_dealer_bid(total_other_bids, bid, cards_dealt)]
+    
+    @staticmethod
+    def get_dealer_allowed_bids(cards_dealt):
+        """
+        Precompute the dealer's legal bids for every possible total of the other bids.
+        
+        Totals above the cards dealt allow every bid and are left out.
+        
+        Args:
+            cards_dealt (int): Number of cards dealt this hand
+            
+        Returns:
+            dict: {total_other_bids: list of legal bids}
+        """
+        return {total: GameService.get_allowed_bids(cards_dealt, True, total)
+                for total in range(cards_dealt + 1)}
+    
+    @staticmethod
+    def get_next_bidder(player_names, dealer_index, current_bids):
+        """
+        Get the next player to bid.
+        
+        Args:
+            player_names (list): Player names in seating order
+            dealer_index (int): Dealer's index
+            current_bids (dict): {player_name: bid} already made
+            
+        Returns:
+            str: Player name, or None if everyone has bid
+        """
+        for i in GameService.get_bidding_order(dealer_index, len(player_names)):
+            if player_names[i] not in current_bids:
+                return player_names[i]
+        return None
+    
+    @staticmethod
+    def get_bids_error(bids, player_names, dealer_index, cards_dealt):
+        """
+        Validate all the bids of a hand in one pass.
+        
+        Bids must cover every player in bidding order (dealer last), each be
+        between 0 and the cards dealt, and the dealer's bid must respect the
+        Hook On rule.
+        
+        Args:
+            bids (list): (player_name, bid) tuples in the order they were made
+            player_names (list): Player names in seating order
+            dealer_index (int): Dealer's index
+            cards_dealt (int): Number of cards dealt this hand
+            
+        Returns:
+            str: Error message, or None if the bids are valid
+        """
+        bidding_order = GameService.get_bidding_order(dealer_index, len(player_names))
+        if [name for name, _ in bids] != [player_names[i] for i in bidding_order]:
+            return 'Bids must be given for every player in bidding order'
+        
+        if any(bid < 0 or bid > cards_dealt for _, bid in bids):
+            return 'Invalid bid'
+        
+        total_other_bids = sum(bid for _, bid in bids[:-1])
+        if not GameService.validate_dealer_bid(total_other_bids, bids[-1][1], cards_dealt):
+            return 'Hook On rule violation'
+        
+        return None
+    
+    @staticmethod
+    def get_tricks_error(tricks, player_names, cards_dealt):
+        """
+        Validate the tricks won by every player in a hand.
+        
+        Args:
+            tricks (dict): {player_name: tricks_won}
+            player_names (list): Player names in seating order
+            cards_dealt (int): Number of cards dealt this hand
+            
+        Returns:
+            str: Error message, or None if the tricks are valid
+        """
+        if sorted(tricks) != sorted(player_names):
+            return 'Tricks must be given for every player'
+        
+        if any(won < 0 or won > cards_dealt for won in tricks.values()):
+            return 'Invalid tricks count'
+        
+        total_tricks = sum(tricks.values())
+        if total_tricks != cards_dealt:
+            return f'Total tricks ({total_tricks}) must equal cards dealt ({cards_dealt})'
+        
+        return None
+    
     @staticmethod
     def calculate_hand_score(bid, won):
         """
@@ -87,10 +195,37 @@ class GameService:
         score = won  # 1 point per trick won
         
         if bid == won:  # Exact bid
-            score += 10
+            score += scoring_engine.EXACT_BID_BONUS
         
         return score
     
+    @staticmethod
+    def calculate_hand_scores(bids, won):
+        """
+        Calculate the scores of one hand for all players at once.
+        
+        Args:
+            bids (list): Tricks bid per player
+            won (list): Tricks won per player
+            
+        Returns:
+            list: Score per player
+        """
+        return scoring_engine.hand_scores(bids, won)
+    
+    @staticmethod
+    def score_game(players):
+        """
+        Score a whole game from the players' hand histories.
+        
+        Args:
+            players (list): List of Player objects
+            
+        Returns:
+            GameScores: Per-hand scores, running totals, invicto flags and ranking
+        """
+        return scoring_engine.score_players(players)
+    
     @staticmethod
     def check_invicto_status(player):
         """
@@ -102,14 +237,7 @@ class GameService:
         Returns:
             bool: True if player made exact bid in all hands
         """
-        if not player.hands:
-            return True
-        
-        for hand in player.hands:
-            if hand['bid'] != hand['won']:
-                return False
-        
-        return True
+        return scoring_engine.score_players([player]).invicto[0]
     
     @staticmethod
     def get_sorted_players_by_score(players):
@@ -122,7 +250,103 @@ class GameService:
         Returns:
             list: Sorted list of players
         """
-        return sorted(players, key=lambda p: p.total_score, reverse=True)
+        ranking = scoring_engine.rank([p.total_score for p in players])
+        return [players[i] for i in ranking]
+    
+    @staticmethod
+    def get_scoreboard(game):
+        """
+        Build the JSON scoreboard of a game.
+        
+        Players are listed by ranking; tied players share the same rank.
+        
+        Args:
+            game (Game): Game
+            
+        Returns:
+            dict: {hands_played, hands_total, is_complete, players, next_hand}
+        """
+        standings = GameService.score_game(game.players)
+        
+        players = []
+        rank = 0
+        previous_total = None
+        for position, index in enumerate(standings.ranking, start=1):
+            player = game.players[index]
+            total = standings.totals[index]
+            if total != previous_total:
+                rank = position
+                previous_total = total
+            players.append({
+                'name': player.name,
+                'rank': rank,
+                'total_score': total,
+                'is_invicto': standings.invicto[index],
+                'last_hand': player.hands[-1] if player.hands else None
+            })
+        
+        next_hand = None
+        if not game.is_complete():
+            next_hand = {
+                'cards': game.get_current_hand()['cards'],
+                'dealer': game.get_current_dealer().name
+            }
+        
+        return {
+            'hands_played': game.current_hand_index,
+            'hands_total': len(game.hands),
+            'is_complete': game.is_complete(),
+            'players': players,
+            'next_hand': next_hand
+        }
+    
+    @staticmethod
+    def get_hand_results(game, hand_index):
+        """
+        Get the results of a played hand for every player.
+        
+        Args:
+            game (Game): Game
+            hand_index (int): Index of a played hand
+            
+        Returns:
+            dict: {hand_index, cards, results: [{name, bid, won, score}]}
+        """
+        results = []
+        for player in game.players:
+            hand = player.hands[hand_index]
+            results.append({'name': player.name, 'bid': hand['bid'], 'won': hand['won'], 'score': hand['score']})
+        
+        return {
+            'hand_index': hand_index,
+            'cards': game.hands[hand_index]['cards'],
+            'results': results
+        }
+    
+    @staticmethod
+    def get_scoreboard_delta(game, since=0):
+        """
+        Build the versioned scoreboard of a game with the hands played after a version.
+        
+        The version is the number of hands played, so it only changes when a
+        hand is committed.
+        
+        Args:
+            game (Game): Game
+            since (int): Version the client already has (0 for every hand)
+            
+        Returns:
+            dict: {version, since, hands, scoreboard}
+        """
+        version = game.current_hand_index
+        since = min(max(since, 0), version)
+        
+        return {
+            'version': version,
+            'since': since,
+            'hands': [GameService.get_hand_results(game, i) for i in range(since, version)],
+            'scoreboard': GameService.get_scoreboard(game)
+        }
     
     @staticmethod
     def calculate_next_dealer_index(current_dealer_index, num_players):
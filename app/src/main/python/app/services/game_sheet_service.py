@@ -1,6 +1,8 @@
 import gspread
+from gspread.utils import a1_range_to_grid_range, absolute_range_name
 from app.sheet_config import SHEET_CONFIG
 from app.services.base_sheets_service import BaseSheetsService
+from app.services.request_scheduler import get_scheduler, BULK
 
 class GameSheetService(BaseSheetsService):
     """Service for Game Sheet management and scoring."""
@@ -24,163 +26,25 @@ class GameSheetService(BaseSheetsService):
             if not sheet:
                 return False
             
-            # Try to find and duplicate the Game Template worksheet
-            worksheet = None
-            try:
-                template = sheet.worksheet('Game Template')
-                worksheet = template.duplicate(new_sheet_name=sheet_name)
-            except gspread.exceptions.WorksheetNotFound:
-                # If template doesn't exist, create new worksheet
-                worksheet = sheet.add_worksheet(title=sheet_name, rows=200, cols=50)
-            except Exception:
-                # Fallback to creating new worksheet
-                if worksheet is None:
-                    worksheet = sheet.add_worksheet(title=sheet_name, rows=200, cols=50)
-            
-            # Build the header structure
-            # Line 1: GAME [sheet name]
-            worksheet.update('A1', f'GAME {sheet_name}')
-            
-            # Line 2: TOURNAMENT [file name]
-            worksheet.update('A2', f'TOURNAMENT {tournament_name}')
-            
-            # Line 3: Number of hands
-            num_hands = len(game.hands) if game else 0
-            worksheet.update('A3', num_hands)
-            worksheet.update('B3', 'number of hands')
-            
-            # Line 4: Total number of tricks
-            total_tricks = sum(hand['cards'] for hand in game.hands) if game else 0
-            worksheet.update('A4', total_tricks)
-            worksheet.update('B4', 'total number of tricks')
-            
-            # Line 5: Blank
+            # Reuse the worksheet of an earlier, interrupted attempt (replays must be idempotent),
+            # otherwise duplicate the Game Template worksheet
+            worksheets = {ws.title: ws for ws in sheet.worksheets()}
+            worksheet = worksheets.get(sheet_name)
+            if worksheet is None:
+                worksheet = self._add_game_worksheet(sheet, sheet_name, worksheets.get('Game Template'))
             
-            # Line 6: Player names (starting from column B, 3 columns wide each)
-            player_headers = []
-            for i, player in enumerate(players):
-                col_start = chr(66 + i * 3)  # B, E, H, K, etc.
-                player_headers.append([player.name, '', ''])
+            # Header values (rows 1-8) in a single values.batchUpdate
+            worksheet.spreadsheet.values_batch_update(
+                params={'valueInputOption': 'RAW'},
+                body={'data': self._build_header_values(worksheet.title, tournament_name, players, game)}
+            )
             
-            # Merge cells for player names
-            for i, player in enumerate(players):
-                col_start_index = 2 + i * 3  # B=2, E=5, H=8, etc.
-                col_start = self._column_letter(col_start_index)
-                col_end = self._column_letter(col_start_index + 2)
-                worksheet.merge_cells(f'{col_start}6:{col_end}6')
-                worksheet.update(f'{col_start}6', player.name)
-            
-            # Line 7: Total Score (initially 0)
-            total_scores = []
-            for i in range(len(players)):
-                col = self._column_letter(2 + i * 3)
-                worksheet.merge_cells(f'{col}7:{self._column_letter(2 + i * 3 + 2)}7')
-                worksheet.update(f'{col}7', 0)
-            
-            # Line 8: BID, WON, SCORE headers for each player
-            headers_row = []
-            for _ in players:
-                headers_row.extend(['BID', 'WON', 'SCORE'])
-            
-            start_col = 'B'
-            end_col = self._column_letter(1 + len(headers_row))
-            worksheet.update(f'{start_col}8:{end_col}8', [headers_row])
-            
-            # Format the header (bold, centered)
+            # Merges, formats and column widths in a single spreadsheets.batchUpdate
             try:
-                # 1. Game Title (A1)
-                self._apply_format(worksheet, 'A1', SHEET_CONFIG['game_title'])
-                
-                # 2. Tournament Name (A2)
-                self._apply_format(worksheet, 'A2', SHEET_CONFIG['tournament_name'])
-                
-                # 3. Player Names (Row 6)
-                # Calculate range for player names
-                last_col_idx = 2 + (len(players) * 3) - 1 # B is 2
-                last_col_letter = self._column_letter(last_col_idx)
-                self._apply_format(worksheet, f'B6:{last_col_letter}6', SHEET_CONFIG['player_names'])
-                
-                # 4. Total Scores (Row 7)
-                self._apply_format(worksheet, f'B7:{last_col_letter}7', SHEET_CONFIG['total_scores'])
-                
-                # 5. Headers (Row 8)
-                self._apply_format(worksheet, f'B8:{last_col_letter}8', SHEET_CONFIG['headers'])
-                
-                # 6. Column Widths
-                col_widths = SHEET_CONFIG['columns']
-                requests = []
-                
-                # Column A (Hand #) - Index 0
-                requests.append({
-                    "updateDimensionProperties": {
-                        "range": {
-                            "sheetId": worksheet.id,
-                            "dimension": "COLUMNS",
-                            "startIndex": 0,
-                            "endIndex": 1
-                        },
-                        "properties": {
-                            "pixelSize": col_widths['cards_dealt']['pixelSize']
-                        },
-                        "fields": "pixelSize"
-                    }
-                })
-                
-                # Player Columns
-                for i in range(len(players)):
-                    base_col_idx = 1 + (i * 3) # B is index 1 (0-based for API)
-                    
-                    # Bid Column
-                    requests.append({
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": worksheet.id,
-                                "dimension": "COLUMNS",
-                                "startIndex": base_col_idx,
-                                "endIndex": base_col_idx + 1
-                            },
-                            "properties": {
-                                "pixelSize": col_widths['bid']['pixelSize']
-                            },
-                            "fields": "pixelSize"
-                        }
-                    })
-                    
-                    # Won Column
-                    requests.append({
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": worksheet.id,
-                                "dimension": "COLUMNS",
-                                "startIndex": base_col_idx + 1,
-                                "endIndex": base_col_idx + 2
-                            },
-                            "properties": {
-                                "pixelSize": col_widths['won']['pixelSize']
-                            },
-                            "fields": "pixelSize"
-                        }
-                    })
-                    
-                    # Score Column
-                    requests.append({
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": worksheet.id,
-                                "dimension": "COLUMNS",
-                                "startIndex": base_col_idx + 2,
-                                "endIndex": base_col_idx + 3
-                            },
-                            "properties": {
-                                "pixelSize": col_widths['score']['pixelSize']
-                            },
-                            "fields": "pixelSize"
-                        }
+                with get_scheduler().priority(BULK):
+                    worksheet.spreadsheet.batch_update({
+                        'requests': self._build_header_requests(worksheet.id, len(players))
                     })
-                
-                if requests:
-                    worksheet.spreadsheet.batch_update({"requests": requests})
-                    
             except Exception as e:
                 print(f"Error applying formatting: {e}")
             
@@ -188,71 +52,243 @@ class GameSheetService(BaseSheetsService):
         except Exception as e:
             print(f"Error creating game sheet: {e}")
             return False
+    
+    @staticmethod
+    def _add_game_worksheet(sheet, sheet_name, template=None):
+        """
+        Add the game worksheet, from the template when there is one.
+        
+        Args:
+            sheet: gspread Spreadsheet
+            sheet_name (str): Game sheet name
+            template: 'Game Template' Worksheet or None
+        
+        Returns:
+            gspread Worksheet
+        """
+        try:
+            if template is not None:
+                return template.duplicate(new_sheet_name=sheet_name)
+            return sheet.add_worksheet(title=sheet_name, rows=200, cols=50)
+        except gspread.exceptions.APIError:
+            # The worksheet may have been added although the response was lost
+            # (e.g. a timeout); if it wasn't, this raises WorksheetNotFound
+            return sheet.worksheet(sheet_name)
 
-    def _apply_format(self, worksheet, range_name, format_dict):
+    def _build_header_values(self, sheet_name, tournament_name, players, game=None):
         """
-        Apply formatting to a range based on config dict.
+        Build the value ranges for the game sheet header.
+        
+        Layout:
+            Row 1: GAME [sheet name]
+            Row 2: TOURNAMENT [file name]
+            Row 3: Number of hands
+            Row 4: Total number of tricks
+            Row 5: Blank
+            Row 6: Player names (starting from column B, 3 columns wide each)
+            Row 7: Total Score (initially 0)
+            Row 8: BID, WON, SCORE headers for each player
         
         Args:
-            worksheet: gspread worksheet object
+            sheet_name (str): Game sheet name
+            tournament_name (str): Tournament name
+            players (list): List of Player objects in play order
+            game: Game object with hands information (optional)
+            
+        Returns:
+            list: ValueRange dicts for values.batchUpdate
+        """
+        num_hands = len(game.hands) if game else 0
+        total_tricks = sum(hand['cards'] for hand in game.hands) if game else 0
+        
+        names_row = []
+        totals_row = []
+        headers_row = []
+        for player in players:
+            names_row.extend([player.name, '', ''])
+            totals_row.extend([0, '', ''])
+            headers_row.extend(['BID', 'WON', 'SCORE'])
+        
+        end_col = self._column_letter(1 + len(headers_row))
+        
+        return [
+            {
+                'range': absolute_range_name(sheet_name, 'A1:A2'),
+                'values': [
+                    [f'GAME {sheet_name}'],
+                    [f'TOURNAMENT {tournament_name}']
+                ]
+            },
+            {
+                'range': absolute_range_name(sheet_name, 'A3:B4'),
+                'values': [
+                    [num_hands, 'number of hands'],
+                    [total_tricks, 'total number of tricks']
+                ]
+            },
+            {
+                'range': absolute_range_name(sheet_name, f'B6:{end_col}8'),
+                'values': [names_row, totals_row, headers_row]
+            }
+        ]
+    
+    def _build_header_requests(self, worksheet_id, num_players):
+        """
+        Build merge, format and column width requests for the game sheet header.
+        
+        Args:
+            worksheet_id (int): Worksheet (grid) ID
+            num_players (int): Number of players
+            
+        Returns:
+            list: Request dicts for spreadsheets.batchUpdate
+        """
+        requests = []
+        
+        # Merge player name (row 6) and total score (row 7) cells, 3 columns per player
+        for i in range(num_players):
+            col_start = self._column_letter(2 + i * 3)  # B, E, H, etc.
+            col_end = self._column_letter(2 + i * 3 + 2)
+            for row in (6, 7):
+                requests.append({
+                    'mergeCells': {
+                        'mergeType': 'MERGE_ALL',
+                        'range': a1_range_to_grid_range(f'{col_start}{row}:{col_end}{row}', worksheet_id)
+                    }
+                })
+        
+        # Text formats
+        last_col_letter = self._column_letter(2 + (num_players * 3) - 1)  # B is 2
+        requests.extend([
+            self._format_request(worksheet_id, 'A1', SHEET_CONFIG['game_title']),
+            self._format_request(worksheet_id, 'A2', SHEET_CONFIG['tournament_name']),
+            self._format_request(worksheet_id, f'B6:{last_col_letter}6', SHEET_CONFIG['player_names']),
+            self._format_request(worksheet_id, f'B7:{last_col_letter}7', SHEET_CONFIG['total_scores']),
+            self._format_request(worksheet_id, f'B8:{last_col_letter}8', SHEET_CONFIG['headers'])
+        ])
+        
+        # Column widths: A (cards dealt), then BID, WON, SCORE for each player
+        col_widths = SHEET_CONFIG['columns']
+        widths = [col_widths['cards_dealt']['pixelSize']]
+        for _ in range(num_players):
+            widths.extend([
+                col_widths['bid']['pixelSize'],
+                col_widths['won']['pixelSize'],
+                col_widths['score']['pixelSize']
+            ])
+        
+        for index, pixel_size in enumerate(widths):
+            requests.append({
+                'updateDimensionProperties': {
+                    'range': {
+                        'sheetId': worksheet_id,
+                        'dimension': 'COLUMNS',
+                        'startIndex': index,
+                        'endIndex': index + 1
+                    },
+                    'properties': {
+                        'pixelSize': pixel_size
+                    },
+                    'fields': 'pixelSize'
+                }
+            })
+        
+        return requests
+
+    @staticmethod
+    def _format_request(worksheet_id, range_name, format_dict):
+        """
+        Build a repeatCell request applying a format config to a range.
+        
+        Args:
+            worksheet_id (int): Worksheet (grid) ID
             range_name (str): Cell range (e.g., 'A1' or 'A1:B2')
             format_dict (dict): Formatting configuration
+            
+        Returns:
+            dict: repeatCell request
         """
-        try:
-            worksheet.format(range_name, format_dict)
-        except Exception as e:
-            print(f"Error formatting range {range_name}: {e}")
+        return {
+            'repeatCell': {
+                'range': a1_range_to_grid_range(range_name, worksheet_id),
+                'cell': {'userEnteredFormat': format_dict},
+                'fields': 'userEnteredFormat(%s)' % ','.join(format_dict.keys())
+            }
+        }
     
-    def add_hand_result(self, tournament_id, sheet_name, hand_number, players_data):
+    def add_hand_result(self, tournament_id, sheet_name, row, hand_number, players_data):
         """
         Add a hand result to the game sheet.
         
         Args:
             tournament_id (str): Tournament Google Sheet ID
             sheet_name (str): Game sheet name
+            row (int): Sheet row for this hand (Game.next_row)
             hand_number (int): Number of cards dealt this hand
-            players_data (list): List of dicts with {bid, won, score} for each player
+            players_data (list): List of dicts with {bid, won, score, total} for each player
             
         Returns:
             bool: True if successful, False otherwise
         """
+        return self.add_hand_results([{
+            'tournament_id': tournament_id,
+            'sheet_name': sheet_name,
+            'row': row,
+            'hand_number': hand_number,
+            'players_data': players_data
+        }])
+    
+    def add_hand_results(self, hands):
+        """
+        Add one or more hand results of the same game sheet.
+        
+        All hand rows and the total scores row are written together in a
+        single values.batchUpdate, using the in-memory totals of the last hand.
+        
+        Args:
+            hands (list): Dicts with {tournament_id, sheet_name, row, hand_number, players_data},
+                          in play order
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not hands:
+            return True
+        
         try:
+            tournament_id = hands[0]['tournament_id']
+            sheet_name = hands[0]['sheet_name']
+            
             sheet = self.get_spreadsheet(tournament_id)
             if not sheet:
                 return False
             
-            worksheet = sheet.worksheet(sheet_name)
-            
-            # Find next empty row (starting from row 9)
-            next_row = len(worksheet.col_values(1)) + 1
-            if next_row < 9:
-                next_row = 9
-            
-            # Build row data: [hand_number, bid1, won1, score1, bid2, won2, score2, ...]
-            row_data = [hand_number]
-            for player_data in players_data:
-                row_data.extend([player_data['bid'], player_data['won'], player_data['score']])
+            data = []
+            for hand in hands:
+                # Build row data: [hand_number, bid1, won1, score1, bid2, won2, score2, ...]
+                row = hand['row']
+                row_data = [hand['hand_number']]
+                for player_data in hand['players_data']:
+                    row_data.extend([player_data['bid'], player_data['won'], player_data['score']])
+                
+                end_col = self._column_letter(len(row_data))
+                data.append({
+                    'range': absolute_range_name(sheet_name, f'A{row}:{end_col}{row}'),
+                    'values': [row_data]
+                })
             
-            # Update the row
-            end_col = self._column_letter(len(row_data))
-            worksheet.update(f'A{next_row}:{end_col}{next_row}', [row_data])
+            # Total scores in row 7 (merged cells, value in the first column)
+            totals_row = []
+            for player_data in hands[-1]['players_data']:
+                totals_row.extend([player_data['total'], '', ''])
+            data.append({
+                'range': absolute_range_name(sheet_name, f'B7:{self._column_letter(1 + len(totals_row))}7'),
+                'values': [totals_row]
+            })
             
-            # Update total scores in row 5
-            self._update_total_scores(worksheet, players_data)
+            sheet.values_batch_update(params={'valueInputOption': 'RAW'}, body={'data': data})
             
             return True
         except Exception as e:
             print(f"Error adding hand result: {e}")
             return False
-    
-    def _update_total_scores(self, worksheet, players_data):
-        """Update total scores in row 7."""
-        try:
-            for i, player_data in enumerate(players_data):
-                col = self._column_letter(2 + i * 3)
-                # Get current total
-                current_total = worksheet.acell(f'{col}7').value or '0'
-                new_total = int(current_total) + player_data['score']
-                worksheet.update(f'{col}7', new_total)
-        except Exception as e:
-            print(f"Error updating total scores: {e}")
@@ -0,0 +1,191 @@
+"""
+Game Store
+
+Server-side store of active game state, keyed by a game ID kept in the
+session. Recently used games are kept hydrated as Game objects in a bounded
+LRU cache; every change is written through to SQLite so games survive an
+eviction or a restart of the app, and the session cookie stays small.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+
+from app.config import Config
+
+
+class GameStore:
+    """
+    Bounded LRU cache of live Game objects with write-through SQLite persistence.
+    
+    Callers mutate the Game returned by get() directly and then persist the
+    change with put(). Request
+    threads share the cached Game, so the mutate-then-save sequence must
+    run under the game's lock().
+    
+    Attributes:
+        path (str): SQLite database file
+        max_games (int): Maximum number of cached games
+        max_bytes (int): Maximum approximate size of the cached games (JSON bytes)
+    """
+    
+    def __init__(self, path, max_games=8, max_bytes=1024 * 1024):
+        """
+        Open (or create) the game store.
+        
+        Args:
+            path (str): SQLite database file
+            max_games (int): Maximum number of cached games
+            max_bytes (int): Maximum approximate size of the cached games (JSON bytes)
+        """
+        self.path = path
+        self.max_games = max(max_games, 1)
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        
+        self._lock = threading.RLock()
+        self._games = OrderedDict()  # {game_id: (Game, approximate size)}, least recently used first
+        self._bytes = 0
+        self._game_locks = {}  # {game_id: RLock}
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS games ('
+            ' game_id TEXT PRIMARY KEY,'
+            ' data TEXT NOT NULL,'
+            ' updated_at TEXT NOT NULL)'
+        )
+    
+    def create(self, game):
+        """
+        Store a new game.
+        
+        Args:
+            game (Game): New game
+        
+        Returns:
+            str: New game ID
+        """
+        game_id = uuid.uuid4().hex
+        self.put(game_id, game)
+        return game_id
+    
+    def get(self, game_id):
+        """
+        Get a live game, loading it from SQLite on a cache miss.
+        
+        Args:
+            game_id (str): Game ID
+        
+        Returns:
+            Game: Cached game instance or None if not found
+        """
+        if not game_id:
+            return None
+        
+        with self._lock:
+            entry = self._games.get(game_id)
+            if entry is not None:
+                self._games.move_to_end(game_id)
+                return entry[0]
+            
+            row = self._conn.execute('SELECT data FROM games WHERE game_id = ?', (game_id,)).fetchone()
+            if row is None:
+                return None
+            
+            from app.models.game import Game
+            
+            game = Game.from_dict(json.loads(row[0]))
+            self._cache(game_id, game, len(row[0]))
+            return game
+    
+    def lock(self, game_id):
+        """
+        Get the lock serializing changes to a game.
+        
+        Args:
+            game_id (str): Game ID
+        
+        Returns:
+            RLock: Per-game lock (the same one for every caller)
+        """
+        with self._lock:
+            return self._game_locks.setdefault(game_id, threading.RLock())
+    
+    def put(self, game_id, game):
+        """
+        Cache a game and write all of it to SQLite.
+        
+        Args:
+            game_id (str): Game ID
+            game (Game): Game to store
+        """
+        data = json.dumps(game.to_dict())
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO games (game_id, data, updated_at) VALUES (?, ?, ?)',
+                (game_id, data, self._now())
+            )
+            self._cache(game_id, game, len(data))
+    
+    def delete(self, game_id):
+        """
+        Remove a game.
+        
+        Args:
+            game_id (str): Game ID
+        """
+        with self._lock:
+            entry = self._games.pop(game_id, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+            self._game_locks.pop(game_id, None)
+            self._conn.execute('DELETE FROM games WHERE game_id = ?', (game_id,))
+    
+    def _cache(self, game_id, game, size):
+        """Add or refresh a cached game and evict the least recently used (caller holds the lock)."""
+        old = self._games.pop(game_id, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._games[game_id] = (game, size)
+        self._bytes += size
+        
+        # Every game is already in SQLite, so evicting only drops the live object
+        while len(self._games) > 1 and (len(self._games) > self.max_games or self._bytes > self.max_bytes):
+            _, (_, evicted_size) = self._games.popitem(last=False)
+            self._bytes -= evicted_size
+    
+    @staticmethod
+    def _now():
+        """Current timestamp for the updated_at column."""
+        return datetime.now().isoformat(timespec='seconds')
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_game_store():
+    """
+    Get the process-wide game store.
+    
+    Returns:
+        GameStore: Shared store
+    """
+    global _store
+    
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = GameStore(
+                    os.path.join(Config.DATA_DIR, 'games.db'),
+                    max_games=Config.GAME_CACHE_SIZE,
+                    max_bytes=Config.GAME_CACHE_MAX_BYTES
+                )
+    
+    return _store
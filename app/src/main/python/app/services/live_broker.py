@@ -0,0 +1,123 @@
+"""
+Live Broker
+
+In-process publish/subscribe hub for live game updates. Routes publish an
+event after each committed hand; every open live scoreboard stream of that
+game receives it through its own bounded queue.
+"""
+
+import queue
+import threading
+
+
+class LiveBroker:
+    """
+    Fan-out of game events to live subscribers.
+    
+    A subscriber that stops reading (its queue is full) is dropped rather
+    than slowing down the publisher; its client reconnects and starts again
+    from a full snapshot.
+    
+    Attributes:
+        max_queue (int): Events buffered per subscriber
+    """
+    
+    def __init__(self, max_queue=100):
+        """
+        Initialize the broker.
+        
+        Args:
+            max_queue (int): Events buffered per subscriber
+        """
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._subscribers = {}  # {game_id: set of queue.Queue}
+    
+    def subscribe(self, game_id):
+        """
+        Subscribe to a game's events.
+        
+        Args:
+            game_id (str): Game ID
+        
+        Returns:
+            queue.Queue: Queue receiving (event, data) tuples
+        """
+        subscriber = queue.Queue(maxsize=self.max_queue)
+        with self._lock:
+            self._subscribers.setdefault(game_id, set()).add(subscriber)
+        return subscriber
+    
+    def unsubscribe(self, game_id, subscriber):
+        """
+        Stop receiving a game's events.
+        
+        Args:
+            game_id (str): Game ID
+            subscriber (queue.Queue): Queue returned by subscribe()
+        """
+        with self._lock:
+            subscribers = self._subscribers.get(game_id)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[game_id]
+    
+    def publish(self, game_id, event, data):
+        """
+        Send an event to every subscriber of a game.
+        
+        Args:
+            game_id (str): Game ID
+            event (str): Event name (e.g. 'hand')
+            data (dict): JSON-serializable event data
+        
+        Returns:
+            int: Number of subscribers that received the event
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(game_id, ()))
+        
+        delivered = 0
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait((event, data))
+                delivered += 1
+            except queue.Full:
+                self.unsubscribe(game_id, subscriber)
+        return delivered
+    
+    def is_subscribed(self, game_id, subscriber):
+        """
+        Check if a subscriber is still receiving a game's events.
+        
+        Args:
+            game_id (str): Game ID
+            subscriber (queue.Queue): Queue returned by subscribe()
+        
+        Returns:
+            bool: False once the subscriber was dropped or unsubscribed
+        """
+        with self._lock:
+            return subscriber in self._subscribers.get(game_id, ())
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_live_broker():
+    """
+    Get the process-wide live broker.
+    
+    Returns:
+        LiveBroker: Shared broker
+    """
+    global _broker
+    
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = LiveBroker()
+    
+    return _broker
@@ -0,0 +1,187 @@
+"""
+Live Share
+
+Serves the read-only live scoreboard to other devices on the local network.
+The app itself stays bound to 127.0.0.1, where only the WebView reaches it;
+a second server on the device's LAN address answers nothing but the live
+scoreboard routes and their static files, so login, admin, /metrics and
+/ready are never exposed.
+"""
+
+import socket
+import threading
+
+from app.config import Config
+
+# Endpoints served on the LAN address (plus the static files they use)
+LIVE_ENDPOINTS = ('game.live_scoreboard', 'game.live_scoreboard_json', 'game.live_stream')
+
+
+def live_path_prefixes(app):
+    """
+    Get the path prefixes of the live scoreboard routes of the app.
+    
+    The prefixes come from the URL map, so they follow the blueprint's
+    url_prefix (e.g. '/game/live/').
+    
+    Args:
+        app: Flask application
+    
+    Returns:
+        tuple: Path prefixes served on the LAN address
+    """
+    prefixes = {app.static_url_path.rstrip('/') + '/'}
+    for rule in app.url_map.iter_rules():
+        if rule.endpoint in LIVE_ENDPOINTS:
+            # Static part of the rule, up to its first variable
+            prefixes.add(rule.rule.split('<', 1)[0])
+    return tuple(sorted(prefixes))
+
+
+class LiveOnlyMiddleware:
+    """WSGI middleware answering 404 for every path but the live scoreboard ones."""
+    
+    def __init__(self, app):
+        """
+        Wrap the Flask application.
+        
+        Args:
+            app: Flask application
+        """
+        self.app = app
+        self.prefixes = live_path_prefixes(app)
+    
+    def allows(self, path):
+        """
+        Check whether a path is served on the LAN address.
+        
+        Args:
+            path (str): Request path
+        
+        Returns:
+            bool: True if the path is passed to the app
+        """
+        return path.startswith(self.prefixes)
+    
+    def __call__(self, environ, start_response):
+        if self.allows(environ.get('PATH_INFO', '')):
+            return self.app(environ, start_response)
+        start_response('404 NOT FOUND', [('Content-Type', 'text/plain; charset=utf-8')])
+        return [b'Not Found']
+
+
+def lan_address():
+    """
+    Get the device's IPv4 address on the local network.
+    
+    Connecting a UDP socket sends no packet; it only makes the OS pick the
+    outgoing interface.
+    
+    Returns:
+        str: LAN address or None if the device is not on a network
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.connect(('10.255.255.255', 1))
+        address = sock.getsockname()[0]
+    except OSError:
+        return None
+    finally:
+        sock.close()
+    
+    if address.startswith('127.') or address == '0.0.0.0':
+        return None
+    return address
+
+
+class LiveShareServer:
+    """
+    Background HTTP server exposing the live scoreboard on the LAN address.
+    
+    Attributes:
+        port (int): Port served on the LAN address
+        host (str): LAN address served, None until started
+    """
+    
+    def __init__(self, port):
+        """
+        Initialize a stopped server.
+        
+        Args:
+            port (int): Port served on the LAN address
+        """
+        self.port = port
+        self.host = None
+        self._lock = threading.Lock()
+        self._thread = None
+        self._middleware = None
+    
+    def start(self, app):
+        """
+        Start serving the live routes of the app on the LAN address (idempotent).
+        
+        Args:
+            app: Flask application
+        
+        Returns:
+            bool: True if the server is running
+        """
+        with self._lock:
+            if self._thread is not None:
+                return True
+            
+            host = lan_address()
+            if host is None:
+                print("Live share: no local network, live scoreboard only on this device")
+                return False
+            
+            middleware = LiveOnlyMiddleware(app)
+            try:
+                from werkzeug.serving import make_server
+                server = make_server(host, self.port, middleware, threaded=True)
+            except Exception as e:
+                print(f"Live share: could not listen on {host}:{self.port}: {e}")
+                return False
+            
+            self._middleware = middleware
+            self.host = host
+            self._thread = threading.Thread(target=server.serve_forever, name='live-share', daemon=True)
+            self._thread.start()
+            print(f"Live share: serving {', '.join(middleware.prefixes)} on http://{host}:{self.port}")
+            return True
+    
+    def url(self, path):
+        """
+        Build the LAN URL of a live scoreboard path.
+        
+        Args:
+            path (str): Path of a live scoreboard route (e.g. from url_for)
+        
+        Returns:
+            str: URL reachable from other devices or None if the server is not
+                 running or does not serve the path
+        """
+        if self.host is None or not self._middleware.allows(path):
+            return None
+        return f'http://{self.host}:{self.port}{path}'
+
+
+_live_share = None
+_live_share_lock = threading.Lock()
+
+
+def get_live_share():
+    """
+    Get the process-wide live share server.
+    
+    Returns:
+        LiveShareServer: Shared server (started by run_android.start_server)
+    """
+    global _live_share
+    
+    if _live_share is None:
+        with _live_share_lock:
+            if _live_share is None:
+                _live_share = LiveShareServer(Config.LIVE_SHARE_PORT)
+    
+    return _live_share
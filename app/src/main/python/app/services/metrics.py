@@ -0,0 +1,270 @@
+"""
+Metrics
+
+Process-wide accounting of Google API calls and HTTP requests: call counts,
+attempts (quota burn, retries included), errors, bytes and latency
+histograms per API operation and per Flask route. Rendered in the
+Prometheus text format by the /metrics endpoint.
+"""
+
+import re
+import threading
+from urllib.parse import urlparse
+
+# Latency histogram bucket upper bounds in seconds (+Inf is implicit)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Route label for calls made outside a request (e.g. the sheet write queue worker)
+BACKGROUND = 'background'
+
+
+class Histogram:
+    """Cumulative latency histogram."""
+    
+    __slots__ = ('counts', 'total', 'count')
+    
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.total = 0.0
+        self.count = 0
+    
+    def observe(self, seconds):
+        """
+        Record one observation.
+        
+        Args:
+            seconds (float): Observed latency
+        """
+        self.total += seconds
+        self.count += 1
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.counts[i] += 1
+
+
+class Metrics:
+    """
+    Thread-safe counters and histograms.
+    
+    The route of the current request is kept per thread (set by the Flask
+    hooks), so API calls are attributed to the route that made them; each
+    request also accumulates its own API call summary.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._calls = {}     # {(operation, route): {calls, attempts, errors, bytes_sent, bytes_received}}
+        self._call_latency = {}  # {(operation, route): Histogram}
+        self._requests = {}  # {(route, status): count}
+        self._request_latency = {}  # {route: Histogram}
+        self._startup = {}  # {step: seconds}
+    
+    def begin_request(self, route):
+        """
+        Start accounting a request on the current thread.
+        
+        Args:
+            route (str): Flask endpoint name
+        """
+        self._local.route = route
+        self._local.summary = {'calls': 0, 'bytes': 0, 'seconds': 0.0}
+    
+    def end_request(self, status, seconds):
+        """
+        Finish accounting the current thread's request.
+        
+        Args:
+            status (int): HTTP status code
+            seconds (float): Time spent handling the request
+        
+        Returns:
+            dict: API call summary of the request {calls, bytes, seconds}
+        """
+        route = getattr(self._local, 'route', None) or 'unknown'
+        summary = getattr(self._local, 'summary', None) or {'calls': 0, 'bytes': 0, 'seconds': 0.0}
+        self._local.route = None
+        self._local.summary = None
+        
+        with self._lock:
+            key = (route, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._request_latency.setdefault(route, Histogram()).observe(seconds)
+        
+        return summary
+    
+    def record_call(self, operation, seconds, attempts=1, bytes_sent=0, bytes_received=0, error=False):
+        """
+        Record one Google API call.
+        
+        Args:
+            operation (str): Operation name (see operation_name())
+            seconds (float): Latency including rate limiting and retries
+            attempts (int): HTTP attempts made (retries included)
+            bytes_sent (int): Request body size
+            bytes_received (int): Response body size
+            error (bool): True if the call finally failed
+        """
+        route = getattr(self._local, 'route', None) or BACKGROUND
+        key = (operation, route)
+        
+        with self._lock:
+            stats = self._calls.get(key)
+            if stats is None:
+                stats = self._calls[key] = {'calls': 0, 'attempts': 0, 'errors': 0,
+                                            'bytes_sent': 0, 'bytes_received': 0}
+            stats['calls'] += 1
+            stats['attempts'] += attempts
+            stats['errors'] += 1 if error else 0
+            stats['bytes_sent'] += bytes_sent
+            stats['bytes_received'] += bytes_received
+            self._call_latency.setdefault(key, Histogram()).observe(seconds)
+        
+        summary = getattr(self._local, 'summary', None)
+        if summary is not None:
+            summary['calls'] += 1
+            summary['bytes'] += bytes_sent + bytes_received
+            summary['seconds'] += seconds
+    
+    def record_startup(self, step, seconds):
+        """
+        Record the duration of a startup step (e.g. a lazily imported module).
+        
+        Args:
+            step (str): Step name
+            seconds (float): Duration
+        """
+        with self._lock:
+            self._startup[step] = seconds
+    
+    def totals(self):
+        """
+        Sum the Google API call counters over every operation and route.
+        
+        Returns:
+            dict: {calls, attempts, errors, bytes_sent, bytes_received}
+        """
+        totals = {'calls': 0, 'attempts': 0, 'errors': 0, 'bytes_sent': 0, 'bytes_received': 0}
+        with self._lock:
+            for stats in self._calls.values():
+                for field in totals:
+                    totals[field] += stats[field]
+        return totals
+    
+    def render(self):
+        """
+        Render every metric in the Prometheus text exposition format.
+        
+        Returns:
+            str: Metrics text
+        """
+        with self._lock:
+            calls = {key: dict(stats) for key, stats in self._calls.items()}
+            call_latency = dict(self._call_latency)
+            requests = dict(self._requests)
+            request_latency = dict(self._request_latency)
+            startup = dict(self._startup)
+        
+        lines = []
+        for name, field, help_text in (
+            ('sheets_calls_total', 'calls', 'Google API calls'),
+            ('sheets_attempts_total', 'attempts', 'Google API HTTP attempts (quota usage, retries included)'),
+            ('sheets_errors_total', 'errors', 'Google API calls that failed after retries'),
+            ('sheets_request_bytes_total', 'bytes_sent', 'Google API request body bytes'),
+            ('sheets_response_bytes_total', 'bytes_received', 'Google API response body bytes'),
+        ):
+            lines.append(f'# HELP podrida_{name} {help_text}')
+            lines.append(f'# TYPE podrida_{name} counter')
+            for (operation, route), stats in sorted(calls.items()):
+                lines.append(f'podrida_{name}{{operation="{operation}",route="{route}"}} {stats[field]}')
+        
+        self._render_histograms(lines, 'sheets_call_seconds', 'Google API call latency',
+                                {'operation="%s",route="%s"' % key: hist for key, hist in call_latency.items()})
+        
+        lines.append('# HELP podrida_http_requests_total HTTP requests by route and status')
+        lines.append('# TYPE podrida_http_requests_total counter')
+        for (route, status), count in sorted(requests.items()):
+            lines.append(f'podrida_http_requests_total{{route="{route}",status="{status}"}} {count}')
+        
+        self._render_histograms(lines, 'http_request_seconds', 'HTTP request latency',
+                                {'route="%s"' % route: hist for route, hist in request_latency.items()})
+        
+        lines.append('# HELP podrida_startup_seconds Duration of each startup and warm-up step')
+        lines.append('# TYPE podrida_startup_seconds gauge')
+        for step, seconds in sorted(startup.items()):
+            lines.append(f'podrida_startup_seconds{{step="{step}"}} {seconds:.6f}')
+        
+        return '\n'.join(lines) + '\n'
+    
+    @staticmethod
+    def _render_histograms(lines, name, help_text, histograms):
+        """Append histograms in the Prometheus text format."""
+        lines.append(f'# HELP podrida_{name} {help_text}')
+        lines.append(f'# TYPE podrida_{name} histogram')
+        for labels, hist in sorted(histograms.items()):
+            for bound, count in zip(LATENCY_BUCKETS, hist.counts):
+                lines.append(f'podrida_{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'podrida_{name}_bucket{{{labels},le="+Inf"}} {hist.count}')
+            lines.append(f'podrida_{name}_sum{{{labels}}} {hist.total:.6f}')
+            lines.append(f'podrida_{name}_count{{{labels}}} {hist.count}')
+
+
+def operation_name(method, url):
+    """
+    Name the API operation of a Sheets/Drive request, without resource IDs.
+    
+    Args:
+        method (str): HTTP method
+        url (str): Request URL
+    
+    Returns:
+        str: Operation name (e.g. 'values.batchUpdate', 'drive.files.list')
+    """
+    method = method.lower()
+    parsed = urlparse(url)
+    path = parsed.path
+    
+    if parsed.netloc == 'sheets.googleapis.com':
+        # Custom methods look like ':batchUpdate' (ranges in the path are percent-encoded)
+        match = re.search(r':([a-z]\w*)$', path)
+        action = match.group(1) if match else None
+        if '/values' in path:
+            if action:
+                return f'values.{action}'
+            return 'values.get' if method == 'get' else 'values.update'
+        if '/sheets/' in path:
+            return f'sheets.{action or method}'
+        if action:
+            return f'spreadsheets.{action}'
+        return 'spreadsheets.get' if method == 'get' else 'spreadsheets.create'
+    
+    match = re.search(r'/drive/v\d+/files(?:/[^/]+(?:/(\w+))?)?$', path)
+    if match:
+        if match.group(1):
+            return f'drive.files.{match.group(1)}'
+        if path.endswith('/files'):
+            return 'drive.files.list' if method == 'get' else 'drive.files.create'
+        return {'get': 'drive.files.get', 'delete': 'drive.files.delete'}.get(method, 'drive.files.update')
+    
+    return f'other.{method}'
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics():
+    """
+    Get the process-wide metrics registry.
+    
+    Returns:
+        Metrics: Shared registry
+    """
+    global _metrics
+    
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = Metrics()
+    
+    return _metrics
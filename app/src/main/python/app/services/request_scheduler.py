@@ -0,0 +1,238 @@
+"""
+Request Scheduler
+
+Central scheduler for Google Sheets/Drive API calls. Enforces a token-bucket
+rate limit shared by the whole process, serves waiting calls by priority and
+retries quota (429) and server (5xx) errors with exponential backoff and jitter.
+Calls that are not safe to repeat (appends, row deletes, file creation) are
+only retried when the API rejected them before applying them.
+"""
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from app.config import Config
+
+# Priorities (lower value is served first)
+INTERACTIVE = 0  # Hand results and other writes the table is waiting for
+NORMAL = 1       # Page reads (tournaments, players, users)
+BULK = 2         # Formatting, stats and other background work
+
+# HTTP status codes worth retrying
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Drive reports rate limits as 403 with one of these reasons
+RATE_LIMIT_REASONS = ('rateLimitExceeded', 'userRateLimitExceeded')
+
+
+class RequestScheduler:
+    """
+    Token-bucket rate limiter with priority queueing and retry.
+    
+    Attributes:
+        rate (float): Tokens added per second
+        capacity (float): Maximum burst size
+        max_retries (int): Retries for a failing call before giving up
+        base_delay (float): First backoff delay in seconds
+        max_delay (float): Maximum backoff delay in seconds
+    """
+    
+    def __init__(self, rate_per_minute, burst, max_retries=5, base_delay=1.0, max_delay=64.0):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            rate_per_minute (float): Sustained calls allowed per minute
+            burst (int): Calls allowed back to back before throttling
+            max_retries (int): Retries for a failing call before giving up
+            base_delay (float): First backoff delay in seconds
+            max_delay (float): Maximum backoff delay in seconds
+        
+        Raises:
+            ValueError: If rate_per_minute is not positive
+        """
+        if rate_per_minute <= 0:
+            raise ValueError(f"Sheets rate must be positive, got {rate_per_minute} per minute")
+        
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(max(burst, 1))
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        
+        self._cond = threading.Condition()
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._waiters = []  # heap of (priority, seq)
+        self._seq = itertools.count()
+        self._local = threading.local()
+    
+    @contextmanager
+    def priority(self, level):
+        """
+        Run the calls made inside the block with the given priority.
+        
+        Args:
+            level (int): INTERACTIVE, NORMAL or BULK
+        """
+        previous = getattr(self._local, 'priority', None)
+        self._local.priority = level
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+    
+    def current_priority(self):
+        """
+        Get the priority of the calling thread.
+        
+        Returns:
+            int: Priority level (NORMAL by default)
+        """
+        level = getattr(self._local, 'priority', None)
+        return NORMAL if level is None else level
+    
+    def acquire(self, priority=None):
+        """
+        Block until a token is available for this call.
+        
+        Waiting calls are served by priority, then in arrival order.
+        
+        Args:
+            priority (int, optional): Priority level (defaults to the thread's priority)
+        """
+        ticket = (self.current_priority() if priority is None else priority, next(self._seq))
+        
+        with self._cond:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    self._refill()
+                    if self._waiters[0] == ticket and self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    self._cond.wait(timeout=max((1 - self._tokens) / self.rate, 0.01))
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+    
+    def call(self, fn, *args, idempotent=True, **kwargs):
+        """
+        Run an API call through the rate limit, retrying transient errors.
+        
+        Args:
+            fn (callable): Function performing the API call
+            idempotent (bool): False if repeating a call the server already
+                               applied would change the result (e.g. an append)
+        
+        Returns:
+            The result of fn
+        
+        Raises:
+            Exception: The last error once retries are exhausted or if not retryable
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_retries or not self.is_retryable(e, idempotent):
+                    raise
+                delay = self._backoff_delay(attempt, e)
+                attempt += 1
+                print(f"Sheets API call failed ({self._describe(e)}), retry {attempt} in {delay:.1f}s")
+                time.sleep(delay)
+    
+    @staticmethod
+    def is_retryable(error, idempotent=True):
+        """
+        Check if an API error is transient (quota, server or network error).
+        
+        A network error or 5xx may come after the server applied the call, so
+        non-idempotent calls are only retried on errors that guarantee it
+        did not: quota rejections and failures to connect.
+        
+        Args:
+            error (Exception): Error raised by the call
+            idempotent (bool): True if the call is safe to repeat
+        
+        Returns:
+            bool: True if the call should be retried
+        """
+        import requests
+        
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return idempotent
+        
+        response = getattr(error, 'response', None)
+        status = getattr(response, 'status_code', None)
+        if status == 429:
+            return True
+        if status in RETRY_STATUS_CODES:
+            return idempotent
+        if status == 403:
+            try:
+                errors = response.json()['error'].get('errors', [])
+            except Exception:
+                return False
+            return any(err.get('reason') in RATE_LIMIT_REASONS for err in errors)
+        return False
+    
+    def _backoff_delay(self, attempt, error):
+        """Exponential backoff with jitter, honoring Retry-After when present."""
+        delay = min(self.base_delay * (2 ** attempt), self.max_delay)
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        
+        response = getattr(error, 'response', None)
+        retry_after = getattr(response, 'headers', {}).get('Retry-After') if response is not None else None
+        try:
+            delay = max(delay, min(float(retry_after), self.max_delay))
+        except (TypeError, ValueError):
+            pass
+        
+        return delay
+    
+    @staticmethod
+    def _describe(error):
+        """Short description of an error for logging."""
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+        return f"HTTP {status}" if status else type(error).__name__
+    
+    def _refill(self):
+        """Add the tokens earned since the last refill (caller holds the lock)."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    """
+    Get the process-wide request scheduler.
+    
+    Returns:
+        RequestScheduler: Shared scheduler configured from Config
+    """
+    global _scheduler
+    
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = RequestScheduler(
+                    rate_per_minute=Config.SHEETS_RATE_PER_MINUTE,
+                    burst=Config.SHEETS_BURST,
+                    max_retries=Config.SHEETS_MAX_RETRIES
+                )
+    
+    return _scheduler
@@ -0,0 +1,146 @@
+"""
+Scoring Engine
+
+Scores whole games at once from bid/won matrices (players x hands): per-hand
+scores, running totals, invicto flags and rankings. Whole-game scoring uses
+NumPy when it is installed and falls back to pure Python otherwise; both
+return plain lists. NumPy is imported on first use, so it does not slow down
+app start-up, and single hands are always scored in pure Python, which is
+faster for a handful of players.
+
+Scoring rule (see GameService.calculate_hand_score): 1 point per trick won,
+plus EXACT_BID_BONUS when the bid is exact.
+"""
+
+EXACT_BID_BONUS = 10
+
+_np = None  # NumPy module once imported, False if it is not installed
+
+
+def _numpy():
+    """
+    Import NumPy on first use.
+    
+    Returns:
+        module: numpy or None if it is not installed
+    """
+    global _np
+    
+    if _np is None:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:  # NumPy is optional
+            _np = False
+    
+    return _np or None
+
+
+class GameScores:
+    """
+    Scores of one game.
+    
+    Rows follow the player order of the input, columns the hand order.
+    
+    Attributes:
+        scores (list): Per-hand scores [player][hand]
+        running_totals (list): Cumulative totals after each hand [player][hand]
+        totals (list): Total score per player
+        invicto (list): True per player with an exact bid in every hand
+        ranking (list): Player indices by total score, highest first (ties keep player order)
+    """
+    
+    def __init__(self, scores, running_totals, totals, invicto, ranking):
+        self.scores = scores
+        self.running_totals = running_totals
+        self.totals = totals
+        self.invicto = invicto
+        self.ranking = ranking
+
+
+def hand_scores(bids, won):
+    """
+    Score one hand for every player.
+    
+    Args:
+        bids (list): Tricks bid per player
+        won (list): Tricks won per player
+    
+    Returns:
+        list: Score per player
+    """
+    return [w + EXACT_BID_BONUS if b == w else w for b, w in zip(bids, won)]
+
+
+def score_matrix(bids, won):
+    """
+    Score a whole game.
+    
+    Args:
+        bids (list): Tricks bid [player][hand]
+        won (list): Tricks won [player][hand]
+    
+    Returns:
+        GameScores: Scores, running totals, invicto flags and ranking
+    """
+    np = _numpy()
+    if np is not None and len(bids):
+        bids = np.asarray(bids, dtype=np.int32)
+        won = np.asarray(won, dtype=np.int32)
+        exact = bids == won
+        scores = won + EXACT_BID_BONUS * exact
+        running_totals = np.cumsum(scores, axis=1)
+        totals = scores.sum(axis=1)
+        ranking = np.argsort(-totals, kind='stable')
+        return GameScores(scores.tolist(), running_totals.tolist(), totals.tolist(),
+                          exact.all(axis=1).tolist(), ranking.tolist())
+    
+    scores = []
+    running_totals = []
+    invicto = []
+    for player_bids, player_won in zip(bids, won):
+        row = []
+        running = []
+        total = 0
+        for b, w in zip(player_bids, player_won):
+            score = w + EXACT_BID_BONUS if b == w else w
+            total += score
+            row.append(score)
+            running.append(total)
+        scores.append(row)
+        running_totals.append(running)
+        invicto.append(all(b == w for b, w in zip(player_bids, player_won)))
+    
+    totals = [running[-1] if running else 0 for running in running_totals]
+    return GameScores(scores, running_totals, totals, invicto, rank(totals))
+
+
+def rank(totals):
+    """
+    Rank players by total score.
+    
+    Args:
+        totals (list): Total score per player
+    
+    Returns:
+        list: Player indices, highest total first (ties keep player order)
+    """
+    np = _numpy()
+    if np is not None and len(totals):
+        return np.argsort(-np.asarray(totals), kind='stable').tolist()
+    
+    return sorted(range(len(totals)), key=lambda i: totals[i], reverse=True)
+
+
+def score_players(players):
+    """
+    Score a game from its players' hand histories.
+    
+    Args:
+        players (list): Player objects (all with the same number of hands)
+    
+    Returns:
+        GameScores: Scores, running totals, invicto flags and ranking
+    """
+    return score_matrix([player.hands.bids for player in players],
+                        [player.hands.won for player in players])
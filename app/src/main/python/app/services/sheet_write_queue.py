@@ -0,0 +1,270 @@
+"""
+Sheet Write Queue
+
+Write-behind sync engine for Google Sheets. Routes commit game state
+locally and append the sheet operation to the game journal; a background
+worker replays unsynced journal entries in order per spreadsheet, in
+batches, retrying failed operations with backoff. A batch that keeps
+failing is set aside, with the rest of its game sheet, so it cannot block
+its spreadsheet for good.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from app.config import Config
+from app.services.game_journal import GameJournal
+
+
+class SheetWriteQueue:
+    """
+    Durable write-behind queue drained by a single worker thread.
+    
+    Pending operations live in the game journal, so they survive a restart
+    of the app and scoring keeps working offline. Operations for the same
+    spreadsheet are applied strictly in order; consecutive operations of a
+    batchable kind for the same game sheet are replayed as one batch. A
+    failing batch blocks only its own spreadsheet, and only until it
+    succeeds or fails max_attempts times in a row; then the entries of its
+    game sheet are marked failed in the journal (kept, in order, for a
+    later requeue) and the spreadsheet moves on.
+    
+    Attributes:
+        journal (GameJournal): Journal holding the pending operations
+        batch_size (int): Maximum entries replayed per batch
+        max_backoff (float): Maximum seconds between retries
+        max_attempts (int): Failed attempts before a batch is set aside
+    """
+    
+    def __init__(self, journal, handlers, batchable=(), batch_size=50, max_backoff=60.0, max_attempts=12):
+        """
+        Initialize the queue.
+        
+        Args:
+            journal (GameJournal): Journal holding the pending operations
+            handlers (dict): {operation_name: callable(payloads) -> bool}
+            batchable (iterable): Operation names that may be replayed in batches
+            batch_size (int): Maximum entries replayed per batch
+            max_backoff (float): Maximum seconds between retries
+            max_attempts (int): Failed attempts before a batch is set aside
+        """
+        self.journal = journal
+        self.handlers = handlers
+        self.batchable = set(batchable)
+        self.batch_size = batch_size
+        self.max_backoff = max_backoff
+        self.max_attempts = max_attempts
+        
+        self._lock = threading.Condition()
+        self._status = OrderedDict()  # {spreadsheet_id: {last_sync, last_error, attempts, retry_at}}
+        self._worker = None
+    
+    def start(self):
+        """Start the background worker thread (idempotent)."""
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name='sheet-write-queue', daemon=True)
+                self._worker.start()
+    
+    def enqueue(self, spreadsheet_id, operation, payload):
+        """
+        Add an operation to the queue.
+        
+        Args:
+            spreadsheet_id (str): Target Google Sheet ID
+            operation (str): Name of a registered handler
+            payload (dict): JSON-serializable operation data (must include sheet_name)
+        
+        Returns:
+            int: Journal entry ID
+        """
+        if operation not in self.handlers:
+            raise ValueError(f"Unknown sheet operation: {operation}")
+        
+        entry_id = self.journal.append(spreadsheet_id, payload.get('sheet_name'), operation, payload)
+        
+        with self._lock:
+            self._lock.notify()
+        
+        return entry_id
+    
+    def status(self, spreadsheet_id=None):
+        """
+        Get queue depth and last sync information.
+        
+        Args:
+            spreadsheet_id (str, optional): Limit the status to one spreadsheet
+        
+        Returns:
+            dict: {pending, failed, last_sync, last_error}
+        """
+        pending = self.journal.pending_count(spreadsheet_id)
+        failed = self.journal.failed_count(spreadsheet_id)
+        
+        with self._lock:
+            if spreadsheet_id is not None:
+                statuses = [self._status.get(spreadsheet_id, {})]
+            else:
+                statuses = list(self._status.values())
+            
+            syncs = [status['last_sync'] for status in statuses if status.get('last_sync')]
+            errors = [status['last_error'] for status in statuses if status.get('last_error')]
+            
+            return {
+                'pending': pending,
+                'failed': failed,
+                'last_sync': max(syncs) if syncs else None,
+                'last_error': errors[0] if errors else None
+            }
+    
+    def _run(self):
+        """Worker loop: replay the oldest batch of each ready spreadsheet."""
+        while True:
+            with self._lock:
+                job = self._next_job()
+                if job is None:
+                    self._lock.wait(timeout=self._next_wait())
+                    continue
+            
+            spreadsheet_id, operation, entries = job
+            try:
+                ok = self.handlers[operation]([entry['payload'] for entry in entries])
+                error = None if ok else f"{operation} failed"
+            except Exception as e:
+                ok = False
+                error = str(e)
+            
+            if ok:
+                try:
+                    self.journal.mark_synced([entry['id'] for entry in entries])
+                except Exception as e:
+                    ok, error = False, f"Error marking journal entries synced: {e}"
+            
+            with self._lock:
+                status = self._status.setdefault(spreadsheet_id, {'attempts': 0, 'retry_at': 0})
+                if ok:
+                    status.update(last_sync=datetime.now().isoformat(timespec='seconds'),
+                                  last_error=None, attempts=0, retry_at=0)
+                    continue
+                
+                status['attempts'] += 1
+                if status['attempts'] < self.max_attempts:
+                    delay = min(2 ** status['attempts'], self.max_backoff)
+                    status.update(last_error=error, retry_at=time.monotonic() + delay)
+                    print(f"Sheet write failed ({error}), retrying in {delay:.0f}s")
+                    continue
+                
+                status.update(last_error=f"{error} (gave up after {status['attempts']} attempts)",
+                              attempts=0, retry_at=0)
+            
+            # Poison batch: set its game sheet aside so the other sheets can sync
+            sheet_name = entries[0]['sheet_name']
+            try:
+                count = self.journal.mark_sheet_failed(spreadsheet_id, sheet_name)
+                print(f"Sheet write failed ({error}), giving up on {count} entries of {sheet_name}")
+            except Exception as e:
+                print(f"Error marking journal entries failed: {e}")
+    
+    def _next_job(self):
+        """
+        Pick the next batch to replay.
+        
+        Returns:
+            tuple: (spreadsheet_id, operation, entries) or None if nothing is ready
+        """
+        try:
+            spreadsheet_ids = self.journal.pending_spreadsheets()
+        except Exception as e:
+            print(f"Error reading journal: {e}")
+            return None
+        
+        now = time.monotonic()
+        with self._lock:
+            ready = [sid for sid in spreadsheet_ids if self._status.get(sid, {}).get('retry_at', 0) <= now]
+            if not ready:
+                return None
+            # Serve spreadsheets round-robin: least recently served first
+            served = list(self._status)
+            ready.sort(key=lambda sid: served.index(sid) if sid in served else -1)
+            spreadsheet_id = ready[0]
+            self._status.setdefault(spreadsheet_id, {'attempts': 0, 'retry_at': 0})
+            self._status.move_to_end(spreadsheet_id)
+        
+        entries = self.journal.pending(spreadsheet_id, limit=self.batch_size)
+        head = entries[0]
+        batch = [head]
+        if head['kind'] in self.batchable:
+            for entry in entries[1:]:
+                if entry['kind'] != head['kind'] or entry['sheet_name'] != head['sheet_name']:
+                    break
+                batch.append(entry)
+        
+        return spreadsheet_id, head['kind'], batch
+    
+    def _next_wait(self):
+        """Seconds until the earliest retry is due (None waits for enqueue)."""
+        retry_times = [status['retry_at'] for status in self._status.values() if status.get('retry_at')]
+        if not retry_times:
+            return None
+        # Never 0, which would make the worker spin on a batch that is just due
+        return max(min(retry_times) - time.monotonic(), 0.05)
+
+
+def _create_game_sheet(payloads):
+    """Replay game creation entries: create each game sheet."""
+    from app.models.game import Game
+    from app.services.game_sheet_service import GameSheetService
+    
+    service = GameSheetService()
+    for payload in payloads:
+        game = Game.from_dict(payload['game'])
+        if not service.create_game_sheet(game.tournament_id, game.sheet_name, game.tournament_name,
+                                         game.players, game):
+            return False
+    return True
+
+
+def _add_hand_results(payloads):
+    """Replay hand result entries for one game sheet as a single batch."""
+    from app.services.game_sheet_service import GameSheetService
+    from app.services.request_scheduler import get_scheduler, INTERACTIVE
+    
+    # Hand results are what the table is waiting on: serve them before bulk work
+    with get_scheduler().priority(INTERACTIVE):
+        return GameSheetService().add_hand_results(payloads)
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_write_queue():
+    """
+    Get the process-wide sheet write queue, starting its worker on first use.
+    
+    Returns:
+        SheetWriteQueue: Shared queue
+    """
+    global _queue
+    
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                journal = GameJournal(os.path.join(Config.DATA_DIR, 'journal.db'))
+                # Batches set aside in an earlier run (e.g. offline for too long) get another chance
+                requeued = journal.requeue_failed()
+                if requeued:
+                    print(f"Requeued {requeued} failed sheet writes")
+                handlers = {
+                    'create_game_sheet': _create_game_sheet,
+                    'add_hand_result': _add_hand_results
+                }
+                queue = SheetWriteQueue(journal, handlers, batchable=['add_hand_result'],
+                                        max_attempts=Config.SHEETS_SYNC_MAX_ATTEMPTS)
+                queue.start()
+                _queue = queue
+    
+    return _queue
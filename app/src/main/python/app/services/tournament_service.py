@@ -1,5 +1,271 @@
+import json
+import os
+import threading
+import time
 import gspread
+from gspread.utils import absolute_range_name
+from app.config import Config
 from app.services.base_sheets_service import BaseSheetsService
+from app.services.request_scheduler import get_scheduler, BULK
+
+
+class TournamentListCache:
+    """
+    Persisted stale-while-revalidate cache of the tournament list.
+    
+    The last known list is served immediately; once it is older than the
+    TTL a single background refresh replaces it. The list is kept in a JSON
+    file so the first visit after a restart renders instantly too.
+    
+    Attributes:
+        path (str): File where the list is persisted
+        ttl (float): Seconds before the list is revalidated
+    """
+    
+    def __init__(self, path, ttl):
+        """
+        Initialize the cache, loading the persisted list if any.
+        
+        Args:
+            path (str): File where the list is persisted
+            ttl (float): Seconds before the list is revalidated
+        """
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._spreadsheets = None
+        self._fetched_at = 0
+        self._refreshing = False
+        self._load()
+    
+    def get(self):
+        """
+        Get the cached list.
+        
+        Returns:
+            list: List of dicts with {id, name} or None if never fetched
+        """
+        with self._lock:
+            return list(self._spreadsheets) if self._spreadsheets is not None else None
+    
+    def is_stale(self):
+        """
+        Check if the list should be revalidated.
+        
+        Returns:
+            bool: True if the list is older than the TTL
+        """
+        with self._lock:
+            return time.time() - self._fetched_at >= self.ttl
+    
+    def set(self, spreadsheets):
+        """
+        Replace the cached list and persist it.
+        
+        Args:
+            spreadsheets (list): List of dicts with {id, name}
+        """
+        with self._lock:
+            self._spreadsheets = list(spreadsheets)
+            self._fetched_at = time.time()
+            self._save()
+    
+    def add(self, spreadsheet):
+        """
+        Add a newly created spreadsheet and mark the list for revalidation.
+        
+        Args:
+            spreadsheet (dict): {id, name}
+        """
+        with self._lock:
+            self._spreadsheets = [s for s in (self._spreadsheets or []) if s['id'] != spreadsheet['id']]
+            self._spreadsheets.append(spreadsheet)
+            self._fetched_at = 0
+            self._save()
+    
+    def revalidate_in_background(self, fetch):
+        """
+        Refresh the list in a background thread, unless a refresh is running.
+        
+        Args:
+            fetch (callable): Returns the fresh list (or None on error)
+        """
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        
+        def refresh():
+            try:
+                spreadsheets = fetch()
+                if spreadsheets is not None:
+                    self.set(spreadsheets)
+            finally:
+                with self._lock:
+                    self._refreshing = False
+        
+        threading.Thread(target=refresh, name='tournament-list-refresh', daemon=True).start()
+    
+    def _load(self):
+        """Load the persisted list."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._spreadsheets = data['spreadsheets']
+            self._fetched_at = data.get('fetched_at', 0)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading tournament list cache: {e}")
+    
+    def _save(self):
+        """Persist the list atomically (caller holds the lock)."""
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'spreadsheets': self._spreadsheets, 'fetched_at': self._fetched_at}, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"Error saving tournament list cache: {e}")
+
+
+_tournament_list = None
+_tournament_list_lock = threading.Lock()
+
+
+def get_tournament_list_cache():
+    """
+    Get the process-wide tournament list cache.
+    
+    Returns:
+        TournamentListCache: Shared cache
+    """
+    global _tournament_list
+    
+    if _tournament_list is None:
+        with _tournament_list_lock:
+            if _tournament_list is None:
+                _tournament_list = TournamentListCache(
+                    os.path.join(Config.DATA_DIR, 'tournaments.json'),
+                    Config.TOURNAMENTS_CACHE_TTL
+                )
+    
+    return _tournament_list
+
+
+class PlayerRosterCache:
+    """
+    In-memory player roster cache keyed by tournament (Google Sheet) ID.
+    
+    Each roster is filled by one read, updated in place when a player is
+    added and refreshed in the background once it is older than the TTL.
+    
+    Attributes:
+        ttl (float): Seconds before a roster is revalidated
+    """
+    
+    def __init__(self, ttl):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            ttl (float): Seconds before a roster is revalidated
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._rosters = {}  # {sheet_id: (players, fetched_at)}
+        self._refreshing = set()
+    
+    def get(self, sheet_id):
+        """
+        Get the cached roster of a tournament.
+        
+        Args:
+            sheet_id (str): Google Sheet ID
+            
+        Returns:
+            list: Sorted player names or None if not cached
+        """
+        with self._lock:
+            entry = self._rosters.get(sheet_id)
+            return list(entry[0]) if entry else None
+    
+    def is_stale(self, sheet_id):
+        """
+        Check if a roster should be revalidated.
+        
+        Args:
+            sheet_id (str): Google Sheet ID
+            
+        Returns:
+            bool: True if the roster is missing or older than the TTL
+        """
+        with self._lock:
+            entry = self._rosters.get(sheet_id)
+            return entry is None or time.monotonic() - entry[1] >= self.ttl
+    
+    def set(self, sheet_id, players):
+        """
+        Replace the roster of a tournament.
+        
+        Args:
+            sheet_id (str): Google Sheet ID
+            players (list): Sorted player names
+        """
+        with self._lock:
+            self._rosters[sheet_id] = (list(players), time.monotonic())
+    
+    def add(self, sheet_id, player_name):
+        """
+        Add a player to a cached roster, keeping it sorted.
+        
+        Args:
+            sheet_id (str): Google Sheet ID
+            player_name (str): Player name
+        """
+        with self._lock:
+            entry = self._rosters.get(sheet_id)
+            if entry:
+                self._rosters[sheet_id] = (sorted(entry[0] + [player_name]), entry[1])
+    
+    def revalidate_in_background(self, sheet_id, fetch):
+        """
+        Refresh a roster in a background thread, unless a refresh is running.
+        
+        Args:
+            sheet_id (str): Google Sheet ID
+            fetch (callable): fetch(sheet_id) returns the fresh roster (or None on error)
+        """
+        with self._lock:
+            if sheet_id in self._refreshing:
+                return
+            self._refreshing.add(sheet_id)
+        
+        def refresh():
+            try:
+                players = fetch(sheet_id)
+                if players is not None:
+                    self.set(sheet_id, players)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(sheet_id)
+        
+        threading.Thread(target=refresh, name='roster-refresh', daemon=True).start()
+
+
+_roster_cache = PlayerRosterCache(Config.ROSTER_CACHE_TTL)
+
+
+def get_roster_cache():
+    """
+    Get the process-wide player roster cache.
+    
+    Returns:
+        PlayerRosterCache: Shared cache
+    """
+    return _roster_cache
+
 
 class TournamentService(BaseSheetsService):
     """Service for Tournament and Player management."""
@@ -8,18 +274,62 @@ class TournamentService(BaseSheetsService):
         """
         List all spreadsheets accessible to the service account.
         
+        Served from the tournament list cache; a stale list is returned
+        as is and refreshed in the background.
+        
         Returns:
             list: List of dicts with {id, name}
         """
+        cache = get_tournament_list_cache()
+        spreadsheets = cache.get()
+        
+        if spreadsheets is None:
+            spreadsheets = self.fetch_spreadsheets()
+            if spreadsheets is None:
+                return []
+            cache.set(spreadsheets)
+        elif cache.is_stale() and self.client:
+            cache.revalidate_in_background(self._fetch_spreadsheets_bulk)
+        
+        return spreadsheets
+    
+    def fetch_spreadsheets(self):
+        """
+        Fetch the spreadsheet list from Drive.
+        
+        Uses a single files.list page of ids and names instead of opening
+        every spreadsheet.
+        
+        Returns:
+            list: List of dicts with {id, name} or None on error
+        """
         if not self.client:
-            return []
+            return None
         
         try:
-            spreadsheets = self.client.openall()
-            return [{'id': s.id, 'name': s.title} for s in spreadsheets]
+            files = self.client.list_spreadsheet_files()
+            return [{'id': f['id'], 'name': f['name']} for f in files]
         except Exception as e:
             print(f"Error listing spreadsheets: {e}")
-            return []
+            return None
+    
+    def _fetch_spreadsheets_bulk(self):
+        """Fetch the spreadsheet list as background work."""
+        with get_scheduler().priority(BULK):
+            return self.fetch_spreadsheets()
+    
+    def prefetch_spreadsheets(self):
+        """
+        Fetch the spreadsheet list into the cache as background work (e.g. during warm-up).
+        
+        Returns:
+            bool: True if the cache was refreshed
+        """
+        spreadsheets = self._fetch_spreadsheets_bulk()
+        if spreadsheets is None:
+            return False
+        get_tournament_list_cache().set(spreadsheets)
+        return True
     
     def create_tournament_sheet(self, tournament_name):
         """
@@ -49,7 +359,9 @@ class TournamentService(BaseSheetsService):
                 worksheet = spreadsheet.add_worksheet(title='Players', rows=100, cols=1)
                 worksheet.update('A1', 'Player Name')
             
-            return {'id': spreadsheet.id, 'name': spreadsheet.title}
+            created = {'id': spreadsheet.id, 'name': spreadsheet.title}
+            get_tournament_list_cache().add(created)
+            return created
         except Exception as e:
             print(f"Error creating tournament sheet: {e}")
             return None
@@ -84,30 +396,73 @@ class TournamentService(BaseSheetsService):
         """
         Get all players from a tournament sheet.
         
+        Served from the roster cache; a stale roster is returned as is and
+        refreshed in the background.
+        
         Args:
             sheet_id (str): Google Sheet ID
             
         Returns:
             list: List of player names (sorted alphabetically)
         """
-        worksheet = self.get_players_worksheet(sheet_id)
-        if not worksheet:
-            return []
+        cache = get_roster_cache()
+        players = cache.get(sheet_id)
+        
+        if players is None:
+            players = self._fetch_players(sheet_id)
+            if players is None:
+                return []
+            cache.set(sheet_id, players)
+        elif cache.is_stale(sheet_id) and self.client:
+            cache.revalidate_in_background(sheet_id, self._fetch_players_bulk)
+        
+        return players
+    
+    def _fetch_players(self, sheet_id):
+        """
+        Read the player names of a tournament sheet with one values request.
+        
+        Args:
+            sheet_id (str): Google Sheet ID
+            
+        Returns:
+            list: List of player names (sorted alphabetically) or None on error
+        """
+        sheet = self.get_spreadsheet(sheet_id)
+        if not sheet:
+            return None
         
         try:
-            # Get all values from column A (skip header)
-            values = worksheet.col_values(1)[1:]  # Skip header row
+            try:
+                # Get all values from column A (skip header)
+                rows = sheet.values_get(absolute_range_name('Players', 'A:A')).get('values', [])
+                values = [row[0] if row else '' for row in rows[1:]]
+            except gspread.exceptions.APIError as e:
+                if not self._is_missing_range(e):
+                    raise
+                # Players worksheet missing: create it
+                worksheet = self.get_players_worksheet(sheet_id)
+                if not worksheet:
+                    return None
+                values = worksheet.col_values(1)[1:]  # Skip header row
+            
             # Filter out empty values and sort
-            players = sorted([name for name in values if name.strip()])
-            return players
+            return sorted([name for name in values if name.strip()])
         except Exception as e:
             print(f"Error getting players: {e}")
-            return []
+            return None
+    
+    def _fetch_players_bulk(self, sheet_id):
+        """Read the player names as background work."""
+        with get_scheduler().priority(BULK):
+            return self._fetch_players(sheet_id)
     
     def add_player(self, sheet_id, player_name):
         """
         Add a player to the Players worksheet.
         
+        The cached roster is updated in place, without re-reading the sheet.
+        
         Args:
             sheet_id (str): Google Sheet ID
             player_name (str): Player name to add
@@ -115,13 +470,43 @@ class TournamentService(BaseSheetsService):
         Returns:
             bool: True if successful, False otherwise
         """
-        worksheet = self.get_players_worksheet(sheet_id)
-        if not worksheet:
+        sheet = self.get_spreadsheet(sheet_id)
+        if not sheet:
             return False
         
         try:
-            worksheet.append_row([player_name])
+            try:
+                sheet.values_append(
+                    absolute_range_name('Players', 'A:A'),
+                    params={'valueInputOption': 'RAW'},
+                    body={'values': [[player_name]]}
+                )
+            except gspread.exceptions.APIError as e:
+                # Only a missing worksheet means the append was not applied
+                if not self._is_missing_range(e):
+                    raise
+                # Players worksheet missing: create it
+                worksheet = self.get_players_worksheet(sheet_id)
+                if not worksheet:
+                    return False
+                worksheet.append_row([player_name])
+            
+            get_roster_cache().add(sheet_id, player_name)
             return True
         except Exception as e:
             print(f"Error adding player: {e}")
             return False
+
+    @staticmethod
+    def _is_missing_range(error):
+        """
+        Check if an API error means the range's worksheet does not exist.
+        
+        Args:
+            error (APIError): Error raised by a values request
+        
+        Returns:
+            bool: True for the 400 "Unable to parse range" error
+        """
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+        return status == 400 and 'Unable to parse range' in str(error)
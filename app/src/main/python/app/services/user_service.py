@@ -1,8 +1,159 @@
+import re
+import threading
+import time
 import gspread
+from gspread.utils import absolute_range_name
 from app.config import Config
 from app.models.user import User
 from app.services.base_sheets_service import BaseSheetsService
 
+
+class UserIndex:
+    """
+    In-memory username index of the users worksheet.
+    
+    Maps username -> (row, password_hash). Filled by one bulk read, patched
+    locally by user mutations (including the row shift after a delete) and
+    reloaded once it is older than its TTL. Shared by every UserService
+    instance in the process.
+    
+    Attributes:
+        ttl (float): Seconds before the index is reloaded from the sheet
+        worksheet_id (int): Grid ID of the users worksheet
+    """
+    
+    def __init__(self, ttl):
+        """
+        Initialize an empty index.
+        
+        Args:
+            ttl (float): Seconds before the index is reloaded from the sheet
+        """
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._users = None  # {username: (row, password_hash)}
+        self._loaded_at = 0
+        self.worksheet_id = None
+    
+    def is_fresh(self):
+        """
+        Check if the index is loaded and within its TTL.
+        
+        Returns:
+            bool: True if the index can be used without a reload
+        """
+        with self._lock:
+            return self._users is not None and time.monotonic() - self._loaded_at < self.ttl
+    
+    def load(self, rows, worksheet_id):
+        """
+        Replace the index with the contents of the users worksheet.
+        
+        Args:
+            rows (list): All worksheet values, header row first
+            worksheet_id (int): Grid ID of the users worksheet
+        """
+        header = rows[0] if rows else []
+        username_col = header.index('username') if 'username' in header else 0
+        hash_col = header.index('password_hash') if 'password_hash' in header else 1
+        
+        users = {}
+        for row_number, values in enumerate(rows[1:], start=2):
+            username = values[username_col] if len(values) > username_col else ''
+            if username:  # Skip empty rows
+                password_hash = values[hash_col] if len(values) > hash_col else ''
+                users[username] = (row_number, password_hash)
+        
+        with self._lock:
+            self._users = users
+            self._loaded_at = time.monotonic()
+            self.worksheet_id = worksheet_id
+    
+    def get(self, username):
+        """
+        Look up a user.
+        
+        Args:
+            username (str): Username
+        
+        Returns:
+            tuple: (row, password_hash) or None if not found
+        """
+        with self._lock:
+            return self._users.get(username) if self._users is not None else None
+    
+    def items(self):
+        """
+        Get all indexed users in sheet order.
+        
+        Returns:
+            list: List of (username, password_hash) tuples
+        """
+        with self._lock:
+            users = sorted((self._users or {}).items(), key=lambda item: item[1][0])
+        return [(username, password_hash) for username, (_, password_hash) in users]
+    
+    def put(self, username, row, password_hash):
+        """
+        Add or replace a user entry.
+        
+        Args:
+            username (str): Username
+            row (int): Worksheet row (None invalidates the index)
+            password_hash (str): Bcrypt hashed password
+        """
+        with self._lock:
+            if self._users is None:
+                return
+            if row is None:
+                self.invalidate()
+                return
+            self._users[username] = (row, password_hash)
+    
+    def rename(self, old_username, username, password_hash):
+        """
+        Update a user entry in place, keeping its row.
+        
+        Args:
+            old_username (str): Current username
+            username (str): New username
+            password_hash (str): Bcrypt hashed password
+        """
+        with self._lock:
+            if self._users is None or old_username not in self._users:
+                self.invalidate()
+                return
+            row, _ = self._users.pop(old_username)
+            self._users[username] = (row, password_hash)
+    
+    def remove(self, username):
+        """
+        Remove a user entry after its row was deleted.
+        
+        Rows below the deleted one move up by one, as they do in the sheet.
+        
+        Args:
+            username (str): Username
+        """
+        with self._lock:
+            if self._users is None or username not in self._users:
+                self.invalidate()
+                return
+            deleted_row, _ = self._users.pop(username)
+            for other, (row, password_hash) in self._users.items():
+                if row > deleted_row:
+                    self._users[other] = (row - 1, password_hash)
+    
+    def invalidate(self):
+        """Drop the index so the next lookup reloads it."""
+        with self._lock:
+            self._users = None
+            self._loaded_at = 0
+
+
+_user_index = UserIndex(Config.USERS_CACHE_TTL)
+
+
 class UserService(BaseSheetsService):
     """Service for User management in Google Sheets."""
     
@@ -16,12 +167,14 @@ class UserService(BaseSheetsService):
         if not self.client or not Config.USERS_SHEET_ID:
             return None
         
+        sheet = self.get_spreadsheet(Config.USERS_SHEET_ID)
+        if not sheet:
+            return None
+        
         try:
-            sheet = self.client.open_by_key(Config.USERS_SHEET_ID)
             return sheet.worksheet('users')
         except gspread.exceptions.WorksheetNotFound:
             # Create the worksheet if it doesn't exist
-            sheet = self.client.open_by_key(Config.USERS_SHEET_ID)
             worksheet = sheet.add_worksheet(title='users', rows=100, cols=3)
             # Add headers
             worksheet.update('A1:B1', [['username', 'password_hash']])
@@ -30,31 +183,48 @@ class UserService(BaseSheetsService):
             print(f"Error accessing users worksheet: {e}")
             return None
     
-    def get_all_users(self):
+    def _ensure_index(self):
         """
-        Get all users from Google Sheets.
+        Load the username index with one bulk read if it is missing or stale.
         
         Returns:
-            list: List of User objects
+            bool: True if the index is usable
         """
+        if _user_index.is_fresh():
+            return True
+        
         worksheet = self.get_users_worksheet()
         if not worksheet:
-            return []
+            return False
         
         try:
-            records = worksheet.get_all_records()
-            users = []
-            for record in records:
-                if record.get('username'):  # Skip empty rows
-                    user = User(
-                        username=record['username'],
-                        password_hash=record.get('password_hash', '')
-                    )
-                    users.append(user)
-            return users
+            _user_index.load(worksheet.get_all_values(), worksheet.id)
+            return True
         except Exception as e:
             print(f"Error getting users: {e}")
+            return False
+    
+    def load_index(self):
+        """
+        Load the username index ahead of the first login (e.g. during warm-up).
+        
+        Returns:
+            bool: True if the index is usable
+        """
+        return self._ensure_index()
+    
+    def get_all_users(self):
+        """
+        Get all users from Google Sheets.
+        
+        Returns:
+            list: List of User objects
+        """
+        if not self._ensure_index():
             return []
+        
+        return [User(username=username, password_hash=password_hash)
+                for username, password_hash in _user_index.items()]
     
     def get_user_by_username(self, username):
         """
@@ -66,11 +236,13 @@ class UserService(BaseSheetsService):
         Returns:
             User: User object or None if not found
         """
-        users = self.get_all_users()
-        for user in users:
-            if user.username == username:
-                return user
-        return None
+        if not self._ensure_index():
+            return None
+        
+        entry = _user_index.get(username)
+        if entry is None:
+            return None
+        return User(username=username, password_hash=entry[1])
     
     def add_user(self, user):
         """
@@ -87,7 +259,8 @@ class UserService(BaseSheetsService):
             return False
         
         try:
-            worksheet.append_row([user.username, user.password_hash])
+            response = worksheet.append_row([user.username, user.password_hash])
+            _user_index.put(user.username, self._appended_row(response), user.password_hash)
             return True
         except Exception as e:
             print(f"Error adding user: {e}")
@@ -97,6 +270,9 @@ class UserService(BaseSheetsService):
         """
         Update an existing user.
         
+        The user's row comes from the username index and is confirmed
+        against the sheet before the write (see _verified_row).
+        
         Args:
             old_username (str): Current username
             updated_user (User): Updated user object
@@ -104,42 +280,123 @@ class UserService(BaseSheetsService):
         Returns:
             bool: True if successful, False otherwise
         """
-        worksheet = self.get_users_worksheet()
-        if not worksheet:
+        if not self._ensure_index():
             return False
         
-        try:
-            # Find the user row
-            cell = worksheet.find(old_username)
-            if cell:
-                row = cell.row
-                worksheet.update(f'A{row}:B{row}', [[updated_user.username, updated_user.password_hash]])
-                return True
+        entry = _user_index.get(old_username)
+        if entry is None:
             return False
+        
+        sheet = self.get_spreadsheet(Config.USERS_SHEET_ID)
+        if not sheet:
+            return False
+        
+        try:
+            row = self._verified_row(sheet, old_username)
+            if row is None:
+                return False
+            sheet.values_update(
+                absolute_range_name('users', f'A{row}:B{row}'),
+                params={'valueInputOption': 'RAW'},
+                body={'values': [[updated_user.username, updated_user.password_hash]]}
+            )
+            _user_index.rename(old_username, updated_user.username, updated_user.password_hash)
+            return True
         except Exception as e:
             print(f"Error updating user: {e}")
+            _user_index.invalidate()
             return False
     
     def delete_user(self, username):
         """
         Delete a user from Google Sheets.
         
+        The user's row comes from the username index and is confirmed
+        against the sheet before the delete (see _verified_row).
+        
         Args:
             username (str): Username to delete
             
         Returns:
             bool: True if successful, False otherwise
         """
-        worksheet = self.get_users_worksheet()
-        if not worksheet:
+        if not self._ensure_index():
             return False
         
-        try:
-            cell = worksheet.find(username)
-            if cell:
-                worksheet.delete_rows(cell.row)
-                return True
+        entry = _user_index.get(username)
+        if entry is None:
+            return False
+        
+        sheet = self.get_spreadsheet(Config.USERS_SHEET_ID)
+        if not sheet:
             return False
+        
+        try:
+            row = self._verified_row(sheet, username)
+            if row is None:
+                return False
+            sheet.batch_update({
+                'requests': [{
+                    'deleteDimension': {
+                        'range': {
+                            'sheetId': _user_index.worksheet_id,
+                            'dimension': 'ROWS',
+                            'startIndex': row - 1,
+                            'endIndex': row
+                        }
+                    }
+                }]
+            })
+            _user_index.remove(username)
+            return True
         except Exception as e:
             print(f"Error deleting user: {e}")
+            _user_index.invalidate()
             return False
+    
+    @staticmethod
+    def _verified_row(sheet, username):
+        """
+        Get the row of a user, confirmed against the sheet before a write.
+        
+        The index may be up to USERS_CACHE_TTL old and another client may
+        have added or deleted rows since, so the indexed row is read back
+        first. If it no longer holds the user, the index is reloaded and the
+        row resolved again.
+        
+        Args:
+            sheet: Users spreadsheet
+            username (str): Username
+        
+        Returns:
+            int: Row number or None if the user is no longer in the sheet
+        """
+        entry = _user_index.get(username)
+        if entry is not None:
+            row = entry[0]
+            values = sheet.values_get(absolute_range_name('users', f'A{row}')).get('values', [])
+            if values and values[0] and values[0][0] == username:
+                return row
+        
+        # Rows moved since the index was loaded
+        _user_index.load(sheet.values_get(absolute_range_name('users')).get('values', []),
+                         _user_index.worksheet_id)
+        entry = _user_index.get(username)
+        return entry[0] if entry else None
+    
+    @staticmethod
+    def _appended_row(response):
+        """
+        Get the row number written by append_row.
+        
+        Args:
+            response (dict): values.append API response
+        
+        Returns:
+            int: Row number or None if it cannot be determined
+        """
+        try:
+            updated_range = response['updates']['updatedRange']  # e.g. "users!A5:B5"
+            return int(re.search(r'!\D+(\d+)', updated_range).group(1))
+        except Exception:
+            return None
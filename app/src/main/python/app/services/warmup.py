@@ -0,0 +1,191 @@
+"""
+Warm-up
+
+Cold start support. The routes import the Google client stack (gspread,
+google-auth, bcrypt) lazily, so the login page is served without it; this
+background warm-up then imports it and pays the other first-request costs
+(service account key parsing, OAuth token exchange, TLS handshakes, the
+user index and tournament list reads) ahead of the first tap that needs
+them. Every step is timed into a startup report, printed once the
+warm-up is done and exported in /metrics; /ready reports the state.
+"""
+
+import importlib
+import sys
+import threading
+import time
+from app.services.metrics import get_metrics
+
+# Lazily imported modules, heaviest third-party stacks first so that each
+# step times one library rather than everything it pulls in
+WARMUP_MODULES = (
+    'requests',
+    'google.auth.transport.requests',
+    'google.oauth2.service_account',
+    'gspread',
+    'bcrypt',
+    'app.services.base_sheets_service',
+    'app.services.user_service',
+    'app.services.auth_service',
+    'app.services.tournament_service',
+    'app.services.game_sheet_service'
+)
+
+
+class Warmup:
+    """
+    Background warm-up runner and startup report.
+    
+    Attributes:
+        modules (tuple): Modules imported by the warm-up, in order
+        state (str): 'idle', 'running', 'ready' or 'failed'
+    """
+    
+    def __init__(self, modules=WARMUP_MODULES):
+        """
+        Initialize an idle warm-up.
+        
+        Args:
+            modules (tuple): Modules imported by the warm-up, in order
+        """
+        self.modules = modules
+        self.state = 'idle'
+        self._lock = threading.Lock()
+        self._steps = []  # [{name, seconds[, error]}]
+        self._thread = None
+    
+    def record(self, name, seconds, error=None):
+        """
+        Add a timed step to the startup report.
+        
+        Args:
+            name (str): Step name
+            seconds (float): Duration
+            error (str, optional): Error message if the step failed
+        """
+        step = {'name': name, 'seconds': round(seconds, 4)}
+        if error:
+            step['error'] = error
+        
+        with self._lock:
+            self._steps.append(step)
+        get_metrics().record_startup(name, seconds)
+    
+    def start(self):
+        """Start the warm-up thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self.state = 'running'
+            self._thread = threading.Thread(target=self._run, name='warmup', daemon=True)
+            self._thread.start()
+    
+    def status(self):
+        """
+        Get the warm-up state and the steps recorded so far.
+        
+        Returns:
+            dict: {state, steps: [{name, seconds[, error]}]}
+        """
+        with self._lock:
+            return {'state': self.state, 'steps': list(self._steps)}
+    
+    def report(self):
+        """
+        Format the startup report.
+        
+        Returns:
+            str: One line per step, slowest steps easy to spot
+        """
+        status = self.status()
+        lines = [f"=== STARTUP REPORT ({status['state']}) ==="]
+        for step in status['steps']:
+            line = f"{step['seconds'] * 1000:8.1f} ms  {step['name']}"
+            if 'error' in step:
+                line += f"  ERROR: {step['error']}"
+            lines.append(line)
+        return '\n'.join(lines)
+    
+    def _run(self):
+        """Warm-up thread: import the lazily loaded modules, then warm the Google client."""
+        ok = True
+        for module in self.modules:
+            if module not in sys.modules:
+                ok = self._step(f'import {module}', lambda: importlib.import_module(module)) and ok
+        
+        ok = ok and self._warm_client()
+        
+        with self._lock:
+            self.state = 'ready' if ok else 'failed'
+        print(self.report())
+    
+    def _warm_client(self):
+        """
+        Authorize the shared client and pre-fetch what the first screens read.
+        
+        Loading the users index opens the pooled connection to the Sheets API
+        and the tournament list the one to the Drive API.
+        
+        Returns:
+            bool: True if every step succeeded
+        """
+        from app.config import Config
+        from app.services.base_sheets_service import get_shared_client
+        from app.services.tournament_service import TournamentService
+        from app.services.user_service import UserService
+        
+        if not self._step('load credentials', get_shared_client):
+            return False
+        
+        # The fake backend session has no token to fetch
+        ensure_token = getattr(get_shared_client().session, 'ensure_token', None)
+        if ensure_token is not None and not self._step('access token', ensure_token):
+            return False
+        
+        ok = True
+        if Config.USERS_SHEET_ID:
+            ok = self._step('users index (Sheets connection)', UserService().load_index)
+        return self._step('tournament list (Drive connection)', TournamentService().prefetch_spreadsheets) and ok
+    
+    def _step(self, name, fn):
+        """
+        Run and time one warm-up step.
+        
+        Args:
+            name (str): Step name
+            fn (callable): Step; raising or returning False means failure
+        
+        Returns:
+            bool: True if the step succeeded
+        """
+        start = time.perf_counter()
+        try:
+            ok = fn() is not False
+            error = None if ok else 'failed (see log)'
+        except Exception as e:
+            ok = False
+            error = str(e)
+        
+        self.record(name, time.perf_counter() - start, error=error)
+        return ok
+
+
+_warmup = None
+_warmup_lock = threading.Lock()
+
+
+def get_warmup():
+    """
+    Get the process-wide warm-up.
+    
+    Returns:
+        Warmup: Shared warm-up
+    """
+    global _warmup
+    
+    if _warmup is None:
+        with _warmup_lock:
+            if _warmup is None:
+                _warmup = Warmup()
+    
+    return _warmup
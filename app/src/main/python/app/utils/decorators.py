@@ -1,5 +1,7 @@
 from functools import wraps
 from flask import session, flash, redirect, url_for, jsonify, request
+from app.services.game_store import get_game_store
+from app.utils.session_helpers import get_active_game
 
 def require_players(f):
     """Decorator to require selected players in session."""
@@ -43,13 +45,21 @@ def require_dealer_config(f):
     return decorated_function
 
 def require_active_game(f):
-    """Decorator to require an active game in session."""
+    """Decorator to require an active game (game store entry for the session's game ID)."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not session.get('game'):
-            if request.is_json or request.path.endswith('/bid') or request.path.endswith('/tricks'):
+        if not get_active_game():
+            if request.is_json:
                 return jsonify({'success': False, 'error': 'No active game'})
             flash('No active game', 'error')
             return redirect(url_for('tournament.select_tournament'))
         return f(*args, **kwargs)
     return decorated_function
+
+def lock_active_game(f):
+    """Decorator to run a view that changes the active game under the game's lock."""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        with get_game_store().lock(session.get('game_id')):
+            return f(*args, **kwargs)
+    return decorated_function
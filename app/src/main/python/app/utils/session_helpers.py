@@ -1,4 +1,46 @@
 from flask import session
+from app.services.game_store import get_game_store
+
+def get_active_game():
+    """
+    Get the session's active game.
+    
+    The game is the live instance cached by the game store: changes made to it
+    must be persisted with save_active_game().
+    
+    Returns:
+        Game: Active game or None if there is no active game
+    """
+    return get_game_store().get(session.get('game_id'))
+
+def start_active_game(game):
+    """
+    Store a new game and make it the session's active game.
+    
+    Only the game ID is kept in the session cookie.
+    
+    Args:
+        game (Game): New game
+    
+    Returns:
+        str: Game ID
+    """
+    old_game_id = session.get('game_id')
+    if old_game_id:
+        get_game_store().delete(old_game_id)
+    
+    game_id = get_game_store().create(game)
+    session['game_id'] = game_id
+    return game_id
+
+def save_active_game(game):
+    """
+    Save the session's active game to the game store.
+    
+    Args:
+        game (Game): Active game
+    """
+    get_game_store().put(session['game_id'], game)
 
 def clear_game_session(keep_config=False):
     """
@@ -9,7 +51,10 @@ def clear_game_session(keep_config=False):
                            and only clears the active game state.
     """
     # Always clear the active game state
-    session.pop('game', None)
+    game_id = session.pop('game_id', None)
+    if game_id:
+        get_game_store().delete(game_id)
+    session.pop('game', None)  # Game state kept in the cookie by older versions
     
     if not keep_config:
         # Clear configuration data
@@ -0,0 +1,6 @@
+"""
+Benchmarks
+
+Scripted end-to-end runs of the app against the fake Sheets backend.
+Run from the Python source root, e.g. `python -m benchmarks.game_flow`.
+"""
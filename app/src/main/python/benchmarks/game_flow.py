@@ -0,0 +1,396 @@
+"""
+Game Flow Benchmark
+
+Drives a whole game through the Flask test client against the fake Sheets
+backend, the way the browser does: login, tournament and player
+selection, game mode, player order, dealer, start, then every hand with
+the requests its templates make (hand page, commit, scores page and the
+scores page's sync status poll). Reports per step the wall time, HTTP
+requests, Google API calls and bytes (background sync included) and the
+session cookie size, and exits with status 1 when a budget is exceeded.
+
+Sync time is the wait for the background sheet writes of a step; it
+includes the request scheduler's quota pacing (SHEETS_RATE_PER_MINUTE),
+as it would in production.
+
+Usage (from the Python source root):
+    python -m benchmarks.game_flow [--players 4] [--mode down_then_up] [--hands N]
+                                   [--latency 0.05] [--error-rate 0.0]
+                                   [--budget sheets_calls_per_hand=3 ...]
+"""
+
+import argparse
+import html
+import os
+import re
+import sys
+import tempfile
+import time
+
+# Budgets checked after the run (override with --budget name=value, 0 disables one)
+DEFAULT_BUDGETS = {
+    'sheets_calls_per_hand': 3,   # Google API calls of the worst hand, background sync included
+    'requests_per_hand': 4,       # HTTP requests of the worst hand
+    'ms_per_hand': 100,           # Mean request time per hand (Google latency must stay off this path)
+    'setup_sheets_calls': 12,     # Google API calls from login to game start, sync included
+    'session_bytes': 1024         # Largest session cookie
+}
+
+TOURNAMENT_NAME = 'Benchmark Cup'
+
+
+def parse_args(argv=None):
+    """
+    Parse the command line.
+    
+    Args:
+        argv (list, optional): Arguments. Defaults to sys.argv[1:].
+    
+    Returns:
+        argparse.Namespace: Parsed options (budgets as a dict)
+    """
+    parser = argparse.ArgumentParser(description='Benchmark a full game against the fake Sheets backend.')
+    parser.add_argument('--players', type=int, default=4, help='Number of players (default: 4)')
+    parser.add_argument('--mode', default='down_then_up', choices=['up', 'down', 'up_then_down', 'down_then_up'],
+                        help='Game mode (default: down_then_up)')
+    parser.add_argument('--hands', type=int, default=None, help='Hands to play (default: the whole game)')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='Mean injected Sheets API latency in seconds (default: 0.05)')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='Fraction of Sheets API calls failing with HTTP 429 (default: 0)')
+    parser.add_argument('--sync-timeout', type=float, default=60.0,
+                        help='Seconds to wait for the background sync after each step (default: 60)')
+    parser.add_argument('--budget', action='append', default=[], metavar='NAME=VALUE',
+                        help='Override a budget (%s)' % ', '.join(sorted(DEFAULT_BUDGETS)))
+    args = parser.parse_args(argv)
+    
+    budgets = dict(DEFAULT_BUDGETS)
+    for item in args.budget:
+        name, _, value = item.partition('=')
+        if name not in budgets:
+            parser.error(f'unknown budget: {name}')
+        try:
+            budgets[name] = float(value)
+        except ValueError:
+            parser.error(f'invalid budget value: {item}')
+    args.budgets = budgets
+    
+    return args
+
+
+def configure_environment(args):
+    """
+    Point the app at the fake Sheets backend and a throwaway data directory.
+    
+    Must run before the app is imported (Config reads the environment once).
+    
+    Args:
+        args (argparse.Namespace): Parsed options
+    """
+    os.environ['SHEETS_BACKEND'] = 'fake'
+    os.environ['SHEETS_FAKE_LATENCY'] = str(args.latency)
+    os.environ['SHEETS_FAKE_ERROR_RATE'] = str(args.error_rate)
+    os.environ['DATA_DIR'] = tempfile.mkdtemp(prefix='podrida-bench-')
+    os.environ.setdefault('USERS_SHEET_ID', 'benchmark-users')
+
+
+class FlowRecorder:
+    """
+    Test client wrapper measuring each step of the flow.
+    
+    Attributes:
+        client: Flask test client
+        steps (list): One dict per step {name, ms, sync_ms, requests, sheets_calls, sheets_bytes, session_bytes}
+    """
+    
+    def __init__(self, client, metrics, write_queue, sync_timeout):
+        """
+        Initialize the recorder.
+        
+        Args:
+            client: Flask test client
+            metrics (Metrics): Process metrics registry
+            write_queue (SheetWriteQueue): Background sheet write queue
+            sync_timeout (float): Seconds to wait for the background sync after a step
+        """
+        self.client = client
+        self.metrics = metrics
+        self.write_queue = write_queue
+        self.sync_timeout = sync_timeout
+        self.steps = []
+        self._current = None
+        self._session_bytes = 0
+    
+    def get(self, url, follow_redirects=True):
+        """Send a GET request as part of the current step."""
+        return self._send(self.client.get, url, follow_redirects=follow_redirects)
+    
+    def post(self, url, follow_redirects=True, **kwargs):
+        """Send a POST request (form `data=` or `json=`) as part of the current step."""
+        return self._send(self.client.post, url, follow_redirects=follow_redirects, **kwargs)
+    
+    def begin(self, name):
+        """
+        Start a step.
+        
+        Args:
+            name (str): Step name
+        """
+        self._current = {'name': name, 'ms': 0.0, 'sync_ms': 0.0, 'requests': 0,
+                         'start_totals': self.metrics.totals()}
+    
+    def wait_for_sync(self):
+        """
+        Wait for the background sheet writes, counting the wait in the current step.
+        
+        Raises:
+            RuntimeError: If the background sync does not finish in time
+        """
+        start = time.perf_counter()
+        deadline = start + self.sync_timeout
+        while self.write_queue.status()['pending']:
+            if time.perf_counter() > deadline:
+                raise RuntimeError(f"Background sync of step '{self._current['name']}' did not finish "
+                                   f"in {self.sync_timeout:.0f}s: {self.write_queue.status()}")
+            time.sleep(0.005)
+        self._current['sync_ms'] += (time.perf_counter() - start) * 1000
+    
+    def end(self):
+        """
+        Finish the current step once its background sync is done.
+        
+        Returns:
+            dict: The recorded step
+        
+        Raises:
+            RuntimeError: If the background sync does not finish in time
+        """
+        self.wait_for_sync()
+        step = self._current
+        self._current = None
+        
+        before = step.pop('start_totals')
+        after = self.metrics.totals()
+        step['sheets_calls'] = after['calls'] - before['calls']
+        step['sheets_bytes'] = (after['bytes_sent'] + after['bytes_received']
+                                - before['bytes_sent'] - before['bytes_received'])
+        step['session_bytes'] = self._session_bytes
+        
+        self.steps.append(step)
+        return step
+    
+    def rename(self, name):
+        """
+        Rename the current step (e.g. once its first page tells what it is).
+        
+        Args:
+            name (str): Step name
+        """
+        self._current['name'] = name
+    
+    def _send(self, method, url, **kwargs):
+        """Send a request, counting redirects followed and the time spent."""
+        start = time.perf_counter()
+        response = method(url, **kwargs)
+        self._current['ms'] += (time.perf_counter() - start) * 1000
+        
+        responses = list(getattr(response, 'history', ())) + [response]
+        self._current['requests'] += len(responses)
+        for r in responses:
+            if r.status_code >= 400:
+                raise RuntimeError(f"{url} answered HTTP {r.status_code}")
+            for cookie in r.headers.getlist('Set-Cookie'):
+                if cookie.startswith('session='):
+                    self._session_bytes = max(self._session_bytes, len(cookie.split(';', 1)[0]) - len('session='))
+        return response
+
+
+def play_game(recorder, args, tournament_id, players):
+    """
+    Run the whole flow, one recorder step per wizard page and per hand.
+    
+    Args:
+        recorder (FlowRecorder): Recorder wrapping the test client
+        args (argparse.Namespace): Parsed options
+        tournament_id (str): Seeded tournament spreadsheet ID
+        players (list): Player names in play order
+    """
+    from app.config import Config
+    
+    setup = [
+        ('login', lambda: recorder.post('/login', data={'username': Config.ADMIN_USERNAME,
+                                                        'password': Config.ADMIN_PASSWORD})),
+        ('tournaments', lambda: recorder.get('/tournament/')),
+        ('select tournament', lambda: recorder.post('/tournament/select', data={'tournament_id': tournament_id,
+                                                                                'tournament_name': TOURNAMENT_NAME})),
+        ('select players', lambda: recorder.post('/tournament/players/select', data={'selected_players': players})),
+        ('game mode', lambda: recorder.post('/game/mode/save', data={'game_mode': args.mode})),
+        ('player order', lambda: recorder.post('/game/order/save', data={'player_order': players})),
+        ('dealer', lambda: recorder.post('/game/dealer/save', data={'dealer_mode': 'start', 'selected_dealer': '0'})),
+        ('start', lambda: recorder.post('/game/start', follow_redirects=False))
+    ]
+    for name, send in setup:
+        recorder.begin(name)
+        send()
+        recorder.end()
+    
+    hands = None
+    number = 0
+    while hands is None or number < hands:
+        number += 1
+        recorder.begin(f"hand {number}")
+        hand_page = recorder.get('/game/hand').get_data(as_text=True)
+        hand = parse_hand_page(hand_page)
+        if hands is None:
+            hands = hand['hands'] if args.hands is None else min(args.hands, hand['hands'])
+        cards = hand['cards']
+        recorder.rename(f"hand {number} ({cards} card{'s' if cards != 1 else ''})")
+        
+        # Everybody bids 0 (always legal: the total never equals the cards dealt);
+        # the first bidder takes every trick
+        bids = [{'player_name': name, 'bid': 0} for name in hand['bidding_order']]
+        tricks = {name: cards if name == hand['bidding_order'][0] else 0 for name in hand['bidding_order']}
+        
+        # finishHand() in bidding.html
+        response = recorder.post('/game/hand/commit', json={'hand_index': hand['hand_index'],
+                                                            'bids': bids, 'tricks': tricks})
+        result = response.get_json()
+        if not result.get('success'):
+            raise RuntimeError(f"Hand {number} rejected: {result}")
+        
+        # scoring.html polls the sync status while writes are pending
+        scores_page = recorder.get(result['scores_url']).get_data(as_text=True)
+        if parse_sync_pending(scores_page):
+            recorder.wait_for_sync()
+            recorder.get('/game/sync-status')
+        recorder.end()
+        
+
+def parse_hand_page(page):
+    """
+    Read what bidding.html gives the browser to play a hand.
+    
+    Args:
+        page (str): Hand page
+    
+    Returns:
+        dict: {hand_index, hands, cards, bidding_order}
+    
+    Raises:
+        RuntimeError: If the page is not the bidding phase of a hand
+    """
+    hand_index = re.search(r'const handIndex = (\d+);', page)
+    hands = re.search(r'Hand \d+ of (\d+)', page)
+    cards = re.search(r'const cardsDealt = (\d+);', page)
+    if not (hand_index and hands and cards):
+        raise RuntimeError('Not a hand page')
+    
+    return {
+        'hand_index': int(hand_index.group(1)),
+        'hands': int(hands.group(1)),
+        'cards': int(cards.group(1)),
+        # Bidding buttons are rendered in bidding order
+        'bidding_order': [html.unescape(name) for name in re.findall(r'id="player-btn-([^"]+)"', page)]
+    }
+
+
+def parse_sync_pending(page):
+    """
+    Read the pending sheet writes scoring.html starts polling for.
+    
+    Args:
+        page (str): Scores page
+    
+    Returns:
+        int: Pending writes when the page was rendered
+    """
+    match = re.search(r'let syncPending = (\d+);', page)
+    return int(match.group(1)) if match else 0
+
+
+def check_budgets(steps, budgets):
+    """
+    Compare the run against the budgets.
+    
+    Args:
+        steps (list): Recorded steps
+        budgets (dict): {budget name: limit} (0 disables a budget)
+    
+    Returns:
+        list: (budget name, measured value, limit) of every exceeded budget
+    """
+    hands = [step for step in steps if step['name'].startswith('hand ')]
+    setup = [step for step in steps if not step['name'].startswith('hand ')]
+    
+    measured = {
+        'sheets_calls_per_hand': max((step['sheets_calls'] for step in hands), default=0),
+        'requests_per_hand': max((step['requests'] for step in hands), default=0),
+        'ms_per_hand': sum(step['ms'] for step in hands) / len(hands) if hands else 0,
+        'setup_sheets_calls': sum(step['sheets_calls'] for step in setup),
+        'session_bytes': max((step['session_bytes'] for step in steps), default=0)
+    }
+    
+    return [(name, measured[name], limit) for name, limit in sorted(budgets.items())
+            if limit and measured[name] > limit]
+
+
+def print_report(steps, args):
+    """Print the per-step table and totals."""
+    print()
+    print(f"Game flow: {args.players} players, mode {args.mode}, "
+          f"Sheets latency {args.latency * 1000:.0f} ms, error rate {args.error_rate:.0%}")
+    print()
+    header = f"{'step':<24} {'ms':>8} {'sync ms':>9} {'requests':>9} {'API calls':>10} {'API bytes':>10} {'session B':>10}"
+    print(header)
+    print('-' * len(header))
+    for step in steps:
+        print(f"{step['name']:<24} {step['ms']:>8.1f} {step['sync_ms']:>9.1f} {step['requests']:>9} "
+              f"{step['sheets_calls']:>10} {step['sheets_bytes']:>10} {step['session_bytes']:>10}")
+    print('-' * len(header))
+    print(f"{'total':<24} {sum(s['ms'] for s in steps):>8.1f} {sum(s['sync_ms'] for s in steps):>9.1f} "
+          f"{sum(s['requests'] for s in steps):>9} {sum(s['sheets_calls'] for s in steps):>10} "
+          f"{sum(s['sheets_bytes'] for s in steps):>10}")
+    print()
+
+
+def main(argv=None):
+    """
+    Run the benchmark.
+    
+    Args:
+        argv (list, optional): Command line arguments
+    
+    Returns:
+        int: Exit status (0 if every budget is met, 1 otherwise)
+    """
+    args = parse_args(argv)
+    configure_environment(args)
+    
+    from app import create_app
+    from app.services.fake_sheets import get_fake_backend
+    from app.services.metrics import get_metrics
+    from app.services.sheet_write_queue import get_write_queue
+    
+    players = [f'Player {i}' for i in range(1, args.players + 1)]
+    tournament_id = get_fake_backend().add_spreadsheet(TOURNAMENT_NAME, {
+        'Players': [['Player Name']] + [[name] for name in players]
+    })
+    
+    app = create_app()
+    app.config['TESTING'] = True
+    recorder = FlowRecorder(app.test_client(), get_metrics(), get_write_queue(), args.sync_timeout)
+    
+    play_game(recorder, args, tournament_id, players)
+    print_report(recorder.steps, args)
+    
+    exceeded = check_budgets(recorder.steps, args.budgets)
+    for name, value, limit in exceeded:
+        print(f"BUDGET EXCEEDED: {name} = {value:g} (limit {limit:g})")
+    if not exceeded:
+        print('All budgets met.')
+    
+    return 1 if exceeded else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,6 +4,7 @@ Flask corre en modo local sin reload.
 """
 import os
 import sys
+import time
 
 # Debug: Mostrar rutas de Python
 print("=== PYTHON PATH DEBUG ===")
@@ -25,7 +26,8 @@ try:
 except Exception as e:
     print(f"Warning: Could not load android_config: {e}")
 
-# Importar la app Flask
+# Importar la app Flask (liviano: el stack de Google se importa después, en segundo plano)
+_startup_start = time.perf_counter()
 try:
     from app import create_app
 except ImportError as e:
@@ -40,6 +42,11 @@ except ImportError as e:
 
 app = create_app()
 
+from app.config import Config
+from app.services.live_share import get_live_share
+from app.services.warmup import get_warmup
+get_warmup().record('app startup (import + create_app)', time.perf_counter() - _startup_start)
+
 def start_server():
     """Inicia el servidor Flask en modo Android."""
     print("=== INICIANDO FLASK DESDE ANDROID ===")
@@ -47,9 +54,17 @@ def start_server():
     print(f"Port: 5000")
     print(f"Python version: {sys.version}")
     
+    # Import the Google client stack and warm it up while the WebView shows the login page
+    get_warmup().start()
+    
+    # Only the live scoreboard routes are served to other devices, on the LAN address
+    if Config.LIVE_SHARE_PORT:
+        get_live_share().start(app)
+    
     try:
         app.run(
             host='127.0.0.1',  # Solo accesible localmente
+            threaded=True,     # Live scoreboard streams stay open
             port=5000,
             debug=False,       # Sin debug en producción
             use_reloader=False # Sin auto-reload